@@ -2,38 +2,42 @@
 
 __version__ = "0.1.0"
 
-from ibkr_trader.backtest.engine import BacktestEngine
-from ibkr_trader.broker import IBKRBroker
-from ibkr_trader.config import IBKRConfig, TradingMode, load_config
-from ibkr_trader.constants import (
-    DEFAULT_PORTFOLIO_SNAPSHOT,
-    MOCK_PRICE_BASE,
-    MOCK_PRICE_SLEEP_SECONDS,
-    MOCK_PRICE_VARIATION_MODULO,
-    SUBSCRIPTION_SOFT_LIMIT,
-)
-from ibkr_trader.market_data import MarketDataService
-from ibkr_trader.models import (
-    OrderRequest,
-    OrderResult,
-    OrderSide,
-    OrderStatus,
-    OrderType,
-    Position,
-    SymbolContract,
-)
-from ibkr_trader.portfolio import PortfolioState, RiskGuard, SymbolLimitRegistry, SymbolLimits
-from ibkr_trader.risk import CorrelationMatrix, CorrelationRiskGuard
-from ibkr_trader.safety import LiveTradingError, LiveTradingGuard
-from ibkr_trader.sim.broker import SimulatedBroker, SimulatedMarketData
-from ibkr_trader.strategies import AdaptiveMomentumConfig, AdaptiveMomentumStrategy
-from ibkr_trader.strategy import (
-    IndustryModelConfig,
-    IndustryModelStrategy,
-    SimpleMovingAverageStrategy,
-    SMAConfig,
-    Strategy,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ibkr_trader.backtest.engine import BacktestEngine
+    from ibkr_trader.broker import IBKRBroker
+    from ibkr_trader.config import IBKRConfig, TradingMode, load_config
+    from ibkr_trader.constants import (
+        DEFAULT_PORTFOLIO_SNAPSHOT,
+        MOCK_PRICE_BASE,
+        MOCK_PRICE_SLEEP_SECONDS,
+        MOCK_PRICE_VARIATION_MODULO,
+        SUBSCRIPTION_SOFT_LIMIT,
+    )
+    from ibkr_trader.market_data import MarketDataService
+    from ibkr_trader.models import (
+        OrderRequest,
+        OrderResult,
+        OrderSide,
+        OrderStatus,
+        OrderType,
+        Position,
+        SymbolContract,
+    )
+    from ibkr_trader.portfolio import PortfolioState, RiskGuard, SymbolLimitRegistry, SymbolLimits
+    from ibkr_trader.risk import CorrelationMatrix, CorrelationRiskGuard
+    from ibkr_trader.safety import LiveTradingError, LiveTradingGuard
+    from ibkr_trader.sim.broker import SimulatedBroker, SimulatedMarketData
+    from ibkr_trader.strategies import AdaptiveMomentumConfig, AdaptiveMomentumStrategy
+    from ibkr_trader.strategy import (
+        IndustryModelConfig,
+        IndustryModelStrategy,
+        SimpleMovingAverageStrategy,
+        SMAConfig,
+        Strategy,
+    )
 
 __all__ = [
     "BacktestEngine",
@@ -72,3 +76,52 @@ __all__ = [
     "SimulatedBroker",
     "SimulatedMarketData",
 ]
+
+# Exports resolve on first access so importing a single submodule (for example
+# ``ibkr_trader.models``) does not pull in pandas via the backtest and data layers.
+_LAZY_EXPORTS: dict[str, str] = {
+    "BacktestEngine": "ibkr_trader.backtest.engine",
+    "IBKRBroker": "ibkr_trader.broker",
+    "IBKRConfig": "ibkr_trader.config",
+    "TradingMode": "ibkr_trader.config",
+    "load_config": "ibkr_trader.config",
+    "DEFAULT_PORTFOLIO_SNAPSHOT": "ibkr_trader.constants",
+    "MOCK_PRICE_BASE": "ibkr_trader.constants",
+    "MOCK_PRICE_SLEEP_SECONDS": "ibkr_trader.constants",
+    "MOCK_PRICE_VARIATION_MODULO": "ibkr_trader.constants",
+    "SUBSCRIPTION_SOFT_LIMIT": "ibkr_trader.constants",
+    "MarketDataService": "ibkr_trader.market_data",
+    "OrderRequest": "ibkr_trader.models",
+    "OrderResult": "ibkr_trader.models",
+    "OrderSide": "ibkr_trader.models",
+    "OrderStatus": "ibkr_trader.models",
+    "OrderType": "ibkr_trader.models",
+    "Position": "ibkr_trader.models",
+    "SymbolContract": "ibkr_trader.models",
+    "PortfolioState": "ibkr_trader.portfolio",
+    "RiskGuard": "ibkr_trader.portfolio",
+    "SymbolLimitRegistry": "ibkr_trader.portfolio",
+    "SymbolLimits": "ibkr_trader.portfolio",
+    "CorrelationMatrix": "ibkr_trader.risk",
+    "CorrelationRiskGuard": "ibkr_trader.risk",
+    "LiveTradingError": "ibkr_trader.safety",
+    "LiveTradingGuard": "ibkr_trader.safety",
+    "SimulatedBroker": "ibkr_trader.sim.broker",
+    "SimulatedMarketData": "ibkr_trader.sim.broker",
+    "AdaptiveMomentumConfig": "ibkr_trader.strategies",
+    "AdaptiveMomentumStrategy": "ibkr_trader.strategies",
+    "IndustryModelConfig": "ibkr_trader.strategy",
+    "IndustryModelStrategy": "ibkr_trader.strategy",
+    "SimpleMovingAverageStrategy": "ibkr_trader.strategy",
+    "SMAConfig": "ibkr_trader.strategy",
+    "Strategy": "ibkr_trader.strategy",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,66 @@
+"""Vectorised SMA crossover kernel for batch replays over recorded prices."""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+
+# Decimal places tried when rescaling float prices to exact integer ticks.
+_MAX_DECIMALS = 8
+# Largest |window sum x period| kept in int64 before falling back to a float comparison.
+_INT_LIMIT = 2**62
+
+
+def _to_ticks(values: npt.NDArray[np.float64]) -> npt.NDArray[np.int64] | None:
+    """Rescale prices to integer ticks, or return None if no scale up to 1e8 is exact."""
+    for decimals in range(_MAX_DECIMALS + 1):
+        scale = 10.0**decimals
+        scaled = np.round(values * scale)
+        if np.array_equal(scaled / scale, values):
+            return scaled.astype(np.int64)
+    return None
+
+
+def sma_signals(prices: npt.ArrayLike, fast: int, slow: int) -> npt.NDArray[np.int8]:
+    """Return crossover signals for a full price series.
+
+    Mirrors ``SimpleMovingAverageStrategy.on_bar``: a bar is +1 when the fast SMA moves above
+    the slow SMA, -1 when it moves back to or below it, and 0 otherwise. No signal is
+    produced until both windows are full, or at all when ``fast > slow`` (the live price
+    history only keeps ``slow`` bars).
+
+    Prices with at most eight decimal places are compared exactly on integer ticks, so an
+    SMA tie counts as "not above" just like the Decimal comparison in ``on_bar``. Other
+    prices fall back to float sums with a relative tie band.
+
+    Args:
+        prices: One-dimensional price series
+        fast: Fast SMA period
+        slow: Slow SMA period
+
+    Returns:
+        int8 array aligned with ``prices``
+    """
+    values = np.asarray(prices, dtype=np.float64)
+    signals = np.zeros(values.shape[0], dtype=np.int8)
+    if fast > slow or values.shape[0] <= slow:
+        return signals
+
+    ends = np.arange(slow, values.shape[0] + 1)
+    ticks = _to_ticks(values)
+    if ticks is not None and int(np.abs(ticks).max()) * slow * slow < _INT_LIMIT:
+        # Window sums from a wrapping int64 cumsum stay exact while each sum fits.
+        cumulative_ticks = np.concatenate(([0], np.cumsum(ticks)))
+        fast_sum = cumulative_ticks[ends] - cumulative_ticks[ends - fast]
+        slow_sum = cumulative_ticks[ends] - cumulative_ticks[ends - slow]
+        # fast_sum / fast > slow_sum / slow without the division
+        above = fast_sum * slow > slow_sum * fast
+    else:
+        cumulative = np.concatenate(([0.0], np.cumsum(values)))
+        fast_sma = (cumulative[ends] - cumulative[ends - fast]) / fast
+        slow_sma = (cumulative[ends] - cumulative[ends - slow]) / slow
+        above = fast_sma - slow_sma > 1e-9 * np.abs(slow_sma)
+
+    crossed = above[1:] != above[:-1]
+    signals[slow:] = np.where(crossed, np.where(above[1:], 1, -1), 0)
+    return signals
@@ -1,11 +1,17 @@
 """CLI entry point for IBKR Personal Trader."""
 
 import typer
+from ib_insync import util
 
 from ibkr_trader.cli_commands.data import data_app
 from ibkr_trader.cli_commands.monitoring import monitoring_app
 from ibkr_trader.cli_commands.trading import trading_app
 
+# ib_insync needs nested event loops under asyncio.run(). Importing the broker module also
+# applies this patch, but the package no longer imports it eagerly and the data commands
+# reach IBKR without it, so the entry point applies it explicitly.
+util.patchAsyncio()
+
 app = typer.Typer(
     name="ibkr-trader",
     help="IBKR Personal Trading Platform - Paper trading by default",
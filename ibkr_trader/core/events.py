@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
@@ -100,6 +100,10 @@ class EventSubscription:
         """Retrieve the next event payload."""
         return await self.__anext__()
 
+    def get_nowait(self) -> object:
+        """Retrieve an already-delivered payload, raising ``asyncio.QueueEmpty`` if none."""
+        return self._queue.get_nowait()
+
     def close(self) -> None:
         """Unsubscribe from the event bus."""
         if self._active:
@@ -131,6 +135,18 @@ class EventBus:
         for queue in queues:
             await queue.put(payload)
 
+    async def publish_many(self, topic: EventTopic, payloads: Iterable[object]) -> None:
+        """Publish several payloads to topic, preserving order, with one subscriber lookup."""
+        async with self._lock:
+            queues = list(self._topics.get(topic, []))
+        for payload in payloads:
+            for queue in queues:
+                await queue.put(payload)
+
+    def reset(self) -> None:
+        """Drop every registered subscriber queue so the bus can be reused."""
+        self._topics.clear()
+
     def _register(self, topic: EventTopic, queue: asyncio.Queue[object]) -> None:
         self._topics[topic].append(queue)
 
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import Awaitable
 from dataclasses import asdict
 from datetime import UTC, datetime
-from decimal import Decimal
 from pathlib import Path
 from typing import Protocol
 
+import orjson
 from loguru import logger
 
 from ibkr_trader.core.events import DiagnosticEvent, EventBus, EventTopic
@@ -50,9 +49,8 @@ class FileTelemetrySink:
         record = asdict(event)
         record["timestamp"] = event.timestamp.isoformat()
         record["context"] = self._sanitize(record.get("context"))
-        with self._path.open("a", encoding="utf-8") as handle:
-            json.dump(record, handle, separators=(",", ":"))
-            handle.write("\n")
+        with self._path.open("ab") as handle:
+            handle.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
 
     def _sanitize(self, value: object) -> object:
         if value is None:
@@ -63,8 +61,7 @@ class FileTelemetrySink:
             return [self._sanitize(v) for v in value]
         if isinstance(value, (str, int, float, bool)):
             return value
-        if isinstance(value, Decimal):
-            return float(value)
+        # Decimal and other values fall through to str so amounts keep their exact precision
         return str(value)
 
 
@@ -6,13 +6,16 @@ against the position).
 """
 
 import asyncio
-import json
+import os
+from collections import defaultdict
+from collections.abc import Callable
 from contextlib import suppress
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
+import orjson
 from loguru import logger
 
 from ibkr_trader.events import EventBus, EventSubscription, EventTopic
@@ -27,6 +30,51 @@ from ibkr_trader.models import (
 from ibkr_trader.telemetry import TelemetryReporter
 
 
+class StateStore(Protocol):
+    """Persistence backend for trailing stop manager state."""
+
+    def load(self) -> dict[str, Any] | None:
+        """Return the last saved state, or None if nothing has been saved."""
+        ...
+
+    def save(self, state: dict[str, Any]) -> None:
+        """Persist the given state."""
+        ...
+
+
+class FileStateStore:
+    """JSON file-backed state store."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[str, Any] | None:
+        if not self.path.exists():
+            return None
+        data: dict[str, Any] = orjson.loads(self.path.read_bytes())
+        return data
+
+    def save(self, state: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(
+            orjson.dumps(state, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+        logger.debug("Saved trailing stop state to {}", self.path)
+
+
+class MemoryStateStore:
+    """In-process state store that never touches disk."""
+
+    def __init__(self) -> None:
+        self._state: dict[str, Any] | None = None
+
+    def load(self) -> dict[str, Any] | None:
+        return self._state
+
+    def save(self, state: dict[str, Any]) -> None:
+        self._state = state
+
+
 class TrailingStop:
     """Active trailing stop state."""
 
@@ -46,6 +94,29 @@ class TrailingStop:
         self.last_update_time: datetime = datetime.now(UTC)
         self.activated: bool = config.activation_price is None
 
+    @property
+    def config(self) -> TrailingStopConfig:
+        """Trailing stop configuration; replace it rather than mutating it in place."""
+        return self._config
+
+    @config.setter
+    def config(self, config: TrailingStopConfig) -> None:
+        self._config = config
+        # Derived once per config so the tick path branches on a bool and skips the
+        # percent division. SELL stops protect long positions.
+        self.is_long: bool = config.side is OrderSide.SELL
+        self._trail_factor = config.trail_factor
+        self._trail_amount = config.trail_amount
+
+    def stop_price_for(self, price: Decimal) -> Decimal:
+        """Return the stop price trailing the given reference price."""
+        if self._trail_factor is not None:
+            return price * self._trail_factor
+        trail_amount: Decimal = self._trail_amount  # type: ignore[assignment]
+        if self.is_long:
+            return price - trail_amount
+        return price + trail_amount
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dict for persistence."""
         return {
@@ -111,19 +182,29 @@ class TrailingStopManager:
         self,
         broker: IBKRBroker,
         event_bus: EventBus,
-        state_file: Path,
+        state_file: str | os.PathLike[str] | StateStore,
         *,
         telemetry: TelemetryReporter | None = None,
         min_update_interval: float = 1.0,
+        time_fn: Callable[[], datetime] | None = None,
     ) -> None:
         self.broker = broker
         self.event_bus = event_bus
-        self.state_file = state_file
+        self.state_store: StateStore = (
+            FileStateStore(Path(state_file))
+            if isinstance(state_file, (str, os.PathLike))
+            else state_file
+        )
         self.active_stops: dict[str, TrailingStop] = {}
+        self._by_symbol: defaultdict[str, list[TrailingStop]] = defaultdict(list)
         self._subscription: EventSubscription | None = None
         self._rate_limiters: dict[str, datetime] = {}  # symbol -> last_update_time
         self._min_update_interval = max(min_update_interval, 0.1)
         self._telemetry = telemetry
+        self._pending_state: dict[str, Any] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        # Wall-clock source for rate limiting; timestamps are persisted, so no monotonic clock.
+        self._now = time_fn or (lambda: datetime.now(UTC))
 
         # Load persisted state
         self._load_state()
@@ -144,33 +225,67 @@ class TrailingStopManager:
         logger.info("TrailingStopManager started, {} active stops", len(self.active_stops))
 
     async def stop(self) -> None:
-        """Stop listening to market data events."""
+        """Stop listening to market data events and flush pending state."""
         if self._subscription:
             self._subscription.close()
         if hasattr(self, "_event_task"):
             self._event_task.cancel()
             with suppress(asyncio.CancelledError):
                 await self._event_task
+        await self.flush()
         logger.info("TrailingStopManager stopped")
 
+    async def flush(self) -> None:
+        """Wait until the latest state snapshot has been written to the state store."""
+        while self._writer_task is not None and not self._writer_task.done():
+            await asyncio.shield(self._writer_task)
+
     async def _process_market_data_events(self) -> None:
-        """Background task to process market data events from subscription."""
+        """Background task to process market data events from subscription.
+
+        Events that queue up while an update is being applied are drained together and
+        conflated to each symbol's high and low, so a burst costs one update per symbol
+        without losing a peak (long stops) or trough (short stops) inside it.
+        """
         if not self._subscription:
             return
 
+        subscription = self._subscription
         try:
             while True:
-                event = await self._subscription.get()
-                # Extract symbol and price from event
-                # Event format depends on what's published to MARKET_DATA topic
-                if hasattr(event, "symbol") and hasattr(event, "price"):
-                    await self._on_market_data(event.symbol, event.price)
-                elif hasattr(event, "symbol") and hasattr(event, "last"):
-                    await self._on_market_data(event.symbol, event.last)
+                ranges: dict[str, tuple[Decimal, Decimal]] = {}
+                self._collect_price(await subscription.get(), ranges)
+                while True:
+                    try:
+                        event = subscription.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    self._collect_price(event, ranges)
+
+                for symbol, (high, low) in ranges.items():
+                    await self._on_price_range(symbol, high, low)
         except asyncio.CancelledError:
             logger.debug("Market data event processing cancelled")
             raise
 
+    def _collect_price(self, event: object, ranges: dict[str, tuple[Decimal, Decimal]]) -> None:
+        """Widen the symbol's (high, low) range by the event's price if a stop trails it."""
+        # Event format depends on what's published to MARKET_DATA topic
+        symbol: str | None = getattr(event, "symbol", None)
+        if symbol is None or symbol not in self._by_symbol:
+            return
+        price = getattr(event, "price", None)
+        if price is None:
+            price = getattr(event, "last", None)
+        if price is None:
+            return
+        current = ranges.get(symbol)
+        if current is None:
+            ranges[symbol] = (price, price)
+        else:
+            high, low = current
+            ranges[symbol] = (max(high, price), min(low, price))
+
     async def create_trailing_stop(self, config: TrailingStopConfig, initial_price: Decimal) -> str:
         """Create and activate a new trailing stop.
 
@@ -181,18 +296,7 @@ class TrailingStopManager:
         Returns:
             stop_id: Unique identifier for this trailing stop
         """
-        # Calculate initial stop price
-        if config.trail_amount:
-            if config.side == OrderSide.SELL:  # Long position
-                stop_price = initial_price - config.trail_amount
-            else:  # Short position
-                stop_price = initial_price + config.trail_amount
-        else:  # trail_percent
-            trail_decimal = config.trail_percent / Decimal("100")  # type: ignore
-            if config.side == OrderSide.SELL:  # Long position
-                stop_price = initial_price * (Decimal("1") - trail_decimal)
-            else:  # Short position
-                stop_price = initial_price * (Decimal("1") + trail_decimal)
+        stop_price = config.stop_price_for(initial_price)
 
         # Place initial stop loss order
         order_request = OrderRequest(
@@ -215,8 +319,10 @@ class TrailingStopManager:
             current_stop_price=stop_price,
             high_water_mark=initial_price,
         )
+        trailing_stop.last_update_time = self._now()
 
         self.active_stops[stop_id] = trailing_stop
+        self._by_symbol[config.symbol].append(trailing_stop)
         self._save_state()
 
         logger.info(
@@ -264,6 +370,10 @@ class TrailingStopManager:
 
         # Remove from active stops
         trailing_stop = self.active_stops.pop(stop_id)
+        symbol_stops = self._by_symbol[trailing_stop.config.symbol]
+        symbol_stops.remove(trailing_stop)
+        if not symbol_stops:
+            del self._by_symbol[trailing_stop.config.symbol]
         self._save_state()
 
         logger.info("Cancelled trailing stop: {}", stop_id)
@@ -284,14 +394,31 @@ class TrailingStopManager:
             symbol: Trading symbol
             price: Current market price
         """
-        # Find all trailing stops for this symbol
-        for stop_id, trailing_stop in list(self.active_stops.items()):
-            if trailing_stop.config.symbol != symbol:
-                continue
+        await self._on_price_range(symbol, price, price)
+
+    async def _on_price_range(self, symbol: str, high: Decimal, low: Decimal) -> None:
+        """Handle a conflated burst of market data for one symbol.
+
+        Long stops only react to the highest price and short stops to the lowest, so the
+        burst's extremes reach the same activation and high water mark as its ticks would.
+
+        Args:
+            symbol: Trading symbol
+            high: Highest price seen in the burst
+            low: Lowest price seen in the burst
+        """
+        stops = self._by_symbol.get(symbol)
+        if not stops:
+            return
+
+        # Copy so a cancellation while awaiting an update cannot disturb iteration
+        for trailing_stop in tuple(stops):
+            stop_id = trailing_stop.stop_id
+            price = high if trailing_stop.is_long else low
 
             # Check activation threshold
             if not trailing_stop.activated and trailing_stop.config.activation_price:
-                if trailing_stop.config.side == OrderSide.SELL:  # Long position
+                if trailing_stop.is_long:
                     if price >= trailing_stop.config.activation_price:
                         trailing_stop.activated = True
                         logger.info(
@@ -331,6 +458,14 @@ class TrailingStopManager:
             if not trailing_stop.activated:
                 continue
 
+            # Most ticks do not extend the high water mark; skip them before any arithmetic.
+            high_water_mark = trailing_stop.high_water_mark
+            if trailing_stop.is_long:
+                if price <= high_water_mark:
+                    continue
+            elif price >= high_water_mark:  # Short position
+                continue
+
             # Update high water mark and calculate new stop price
             await self._update_stop_if_needed(trailing_stop, price)
 
@@ -341,38 +476,25 @@ class TrailingStopManager:
             trailing_stop: Trailing stop to update
             price: Current market price
         """
-        config = trailing_stop.config
         new_stop_price = None
 
         # For long positions (SELL stop)
-        if config.side == OrderSide.SELL:
+        if trailing_stop.is_long:
             if price > trailing_stop.high_water_mark:
                 # Price increased, update high water mark
                 trailing_stop.high_water_mark = price
-
-                # Calculate new stop price
-                if config.trail_amount:
-                    new_stop_price = price - config.trail_amount
-                else:  # trail_percent
-                    trail_decimal = config.trail_percent / Decimal("100")  # type: ignore
-                    new_stop_price = price * (Decimal("1") - trail_decimal)
+                new_stop_price = trailing_stop.stop_price_for(price)
 
         # For short positions (BUY stop)
         else:
             if price < trailing_stop.high_water_mark:
                 # Price decreased, update high water mark
                 trailing_stop.high_water_mark = price
-
-                # Calculate new stop price
-                if config.trail_amount:
-                    new_stop_price = price + config.trail_amount
-                else:  # trail_percent
-                    trail_decimal = config.trail_percent / Decimal("100")  # type: ignore
-                    new_stop_price = price * (Decimal("1") + trail_decimal)
+                new_stop_price = trailing_stop.stop_price_for(price)
 
         # Only update if new stop is better (never widen)
         if new_stop_price is not None and new_stop_price != trailing_stop.current_stop_price:
-            if config.side == OrderSide.SELL:
+            if trailing_stop.is_long:
                 # Long: new stop should be higher
                 if new_stop_price > trailing_stop.current_stop_price:
                     await self._modify_stop_order(trailing_stop, new_stop_price)
@@ -394,7 +516,7 @@ class TrailingStopManager:
         previous_price = trailing_stop.current_stop_price
 
         # Check rate limit
-        now = datetime.now(UTC)
+        now = self._now()
         if symbol in self._rate_limiters:
             last_update = self._rate_limiters[symbol]
             time_since_update = (now - last_update).total_seconds()
@@ -446,7 +568,12 @@ class TrailingStopManager:
             )
 
     def _save_state(self) -> None:
-        """Persist active trailing stops to disk."""
+        """Queue a snapshot of active trailing stops for the state store.
+
+        Inside a running event loop the write happens on a background task off the loop
+        thread; snapshots queued before it runs are coalesced so only the newest is written.
+        Without a running loop the snapshot is written immediately.
+        """
         state_data = {
             "stops": [stop.to_dict() for stop in self.active_stops.values()],
             "rate_limiters": {
@@ -455,24 +582,36 @@ class TrailingStopManager:
             "min_update_interval": self._min_update_interval,
             "version": 2,
         }
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.state_store.save(state_data)
+            return
 
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps(state_data, indent=2))
+        self._pending_state = state_data
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._write_pending_state())
 
-        logger.debug("Saved trailing stop state to {}", self.state_file)
+    async def _write_pending_state(self) -> None:
+        """Drain queued snapshots, writing only the most recent one each pass."""
+        while self._pending_state is not None:
+            state_data, self._pending_state = self._pending_state, None
+            try:
+                await asyncio.to_thread(self.state_store.save, state_data)
+            except Exception as e:
+                logger.error("Failed to save trailing stop state: {}", e)
 
     def _load_state(self) -> None:
-        """Load persisted trailing stops from disk."""
-        if not self.state_file.exists():
-            logger.debug("No trailing stop state file found")
-            return
-
+        """Load persisted trailing stops from the state store."""
         try:
-            state_raw = self.state_file.read_text()
-            state_data = json.loads(state_raw)
+            state_data = self.state_store.load()
+            if state_data is None:
+                logger.debug("No persisted trailing stop state found")
+                return
             for stop_dict in state_data.get("stops", []):
                 trailing_stop = TrailingStop.from_dict(stop_dict)
                 self.active_stops[trailing_stop.stop_id] = trailing_stop
+                self._by_symbol[trailing_stop.config.symbol].append(trailing_stop)
                 self._rate_limiters[trailing_stop.config.symbol] = trailing_stop.last_update_time
 
             rate_limit_data = state_data.get("rate_limiters") or {}
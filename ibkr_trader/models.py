@@ -261,6 +261,30 @@ class TrailingStopConfig(BaseModel):
             raise ValueError(f"trail_percent must be between 0 and 100, got {v}")
         return v
 
+    @property
+    def trail_factor(self) -> Decimal | None:
+        """Price multiplier for percent trailing, or None when trailing by amount.
+
+        Derived on access rather than cached, since the model is mutable and copies
+        made with ``model_copy(update=...)`` skip validation.
+        """
+        if self.trail_amount or self.trail_percent is None:
+            return None
+        trail_decimal = self.trail_percent / Decimal("100")
+        if self.side == OrderSide.SELL:  # Long position
+            return Decimal("1") - trail_decimal
+        return Decimal("1") + trail_decimal
+
+    def stop_price_for(self, price: Decimal) -> Decimal:
+        """Return the stop price trailing the given reference price."""
+        trail_factor = self.trail_factor
+        if trail_factor is not None:
+            return price * trail_factor
+        trail_amount: Decimal = self.trail_amount  # type: ignore[assignment]
+        if self.side == OrderSide.SELL:  # Long position
+            return price - trail_amount
+        return price + trail_amount
+
 
 class OCOOrderRequest(BaseModel):
     """One-Cancels-Other order pair.
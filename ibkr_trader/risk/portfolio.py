@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field
@@ -311,9 +311,20 @@ class SymbolLimitRegistry:
         if config_path and config_path.exists():
             self._load_config(config_path)
 
-    def _load_config(self, path: Path) -> None:
+    @classmethod
+    def load(cls, source: Path | IO[bytes]) -> SymbolLimitRegistry:
+        """Build a registry from a JSON config file or an open binary stream."""
+        if isinstance(source, Path):
+            return cls(config_path=source)
+        registry = cls()
+        registry._load_config(source)
+        return registry
+
+    def _load_config(self, path: Path | IO[bytes]) -> None:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = json.loads(
+                path.read_text(encoding="utf-8") if isinstance(path, Path) else path.read()
+            )
 
             default_data = data.get("default_limits", {})
             if default_data:
@@ -365,7 +376,7 @@ class SymbolLimitRegistry:
         symbol = symbol.upper()
         return self.symbol_limits.get(symbol, self.default_limits)
 
-    def save_config(self, path: Path) -> None:
+    def save_config(self, path: Path | IO[bytes]) -> None:
         data: dict[str, Any] = {}
 
         if self.default_limits:
@@ -396,8 +407,12 @@ class SymbolLimitRegistry:
             }
 
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            payload = json.dumps(data, indent=2)
+            if isinstance(path, Path):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(payload, encoding="utf-8")
+            else:
+                path.write(payload.encode("utf-8"))
             logger.info("Saved symbol limits to {}", path)
         except Exception as exc:
             logger.error("Failed to save symbol limits to {}: {}", path, exc)
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import heapq
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pandas as pd
 from model.data.models import (
     BookSide,
@@ -19,12 +21,46 @@ from model.data.models import (
 )
 
 
+def _read_frame(path: Path) -> pd.DataFrame:
+    """Read a replay input file, using Arrow IPC for ``.feather`` files and CSV otherwise."""
+    if Path(path).suffix == ".feather":
+        return pd.read_feather(path)
+    return pd.read_csv(path)
+
+
 @dataclass(slots=True)
 class ReplayEvent:
     timestamp: datetime
     payload: object
 
 
+def _order_book_snapshot(timestamp: str, records: Sequence[Mapping[Any, Any]]) -> ReplayEvent:
+    """Build a replay event from the depth records sharing one timestamp."""
+    levels = [
+        OrderBookLevel(
+            side=BookSide(str(record["side"])),
+            price=float(record["price"]),
+            size=float(record["size"]),
+            level=int(record["level"]),
+            num_orders=int(record["num_orders"])
+            if "num_orders" in record and pd.notna(record["num_orders"])
+            else None,
+        )
+        for record in records
+    ]
+    first = records[0]
+    parsed = datetime.fromisoformat(timestamp)
+    return ReplayEvent(
+        timestamp=parsed,
+        payload=OrderBookSnapshot(
+            timestamp=parsed,
+            symbol=str(first["symbol"]),
+            levels=levels,
+            venue=str(first.get("venue", "")) or None,
+        ),
+    )
+
+
 class EventLoader:
     """Loads depth, trade, and option surface data into replayable events."""
 
@@ -37,6 +73,23 @@ class EventLoader:
         self.order_book_files = list(order_book_files or [])
         self.trade_files = list(trade_files or [])
         self.option_surface_files = list(option_surface_files or [])
+        self.order_book_arrays: list[np.ndarray] = []
+
+    @classmethod
+    def from_arrays(cls, *, order_book: np.ndarray | Sequence[np.ndarray]) -> EventLoader:
+        """Create a loader over in-memory order book record arrays.
+
+        Each array must be a NumPy structured/record array with the same fields as the
+        order book CSV schema. Rows are grouped by timestamp without building a DataFrame.
+        """
+        loader = cls()
+        arrays = [order_book] if isinstance(order_book, np.ndarray) else list(order_book)
+        required = {"timestamp", "symbol", "side", "price", "size", "level"}
+        for array in arrays:
+            if not required.issubset(array.dtype.names or ()):
+                raise ValueError(f"order book array missing required fields {required}")
+        loader.order_book_arrays = arrays
+        return loader
 
     def load_events(self) -> Iterator[ReplayEvent]:
         queue: list[tuple[datetime, int, object]] = []
@@ -47,6 +100,8 @@ class EventLoader:
 
         if self.order_book_files:
             enqueue(self._load_order_books())
+        if self.order_book_arrays:
+            enqueue(self._load_order_book_arrays())
         if self.trade_files:
             enqueue(self._load_trades())
         if self.option_surface_files:
@@ -58,38 +113,27 @@ class EventLoader:
 
     def _load_order_books(self) -> Iterator[ReplayEvent]:
         for file_path in self.order_book_files:
-            frame = pd.read_csv(file_path)
+            frame = _read_frame(file_path)
             required = {"timestamp", "symbol", "side", "price", "size", "level"}
             if not required.issubset(frame.columns):
                 raise ValueError(f"{file_path} missing required columns {required}")
 
-            grouped = frame.groupby("timestamp")
-            for timestamp, group in grouped:
-                levels = [
-                    OrderBookLevel(
-                        side=BookSide(level["side"]),
-                        price=float(level["price"]),
-                        size=float(level["size"]),
-                        level=int(level["level"]),
-                        num_orders=int(level["num_orders"])
-                        if "num_orders" in level and pd.notna(level["num_orders"])
-                        else None,
-                    )
-                    for level in group.to_dict("records")
-                ]
-                yield ReplayEvent(
-                    timestamp=datetime.fromisoformat(timestamp),
-                    payload=OrderBookSnapshot(
-                        timestamp=datetime.fromisoformat(timestamp),
-                        symbol=str(group.iloc[0]["symbol"]),
-                        levels=levels,
-                        venue=str(group.iloc[0].get("venue", "")) or None,
-                    ),
-                )
+            for timestamp, group in frame.groupby("timestamp"):
+                yield _order_book_snapshot(str(timestamp), group.to_dict("records"))
+
+    def _load_order_book_arrays(self) -> Iterator[ReplayEvent]:
+        for array in self.order_book_arrays:
+            names = array.dtype.names or ()
+            grouped: dict[str, list[dict[str, Any]]] = {}
+            for row in array.tolist():
+                record = dict(zip(names, row, strict=True))
+                grouped.setdefault(str(record["timestamp"]), []).append(record)
+            for timestamp in sorted(grouped):
+                yield _order_book_snapshot(timestamp, grouped[timestamp])
 
     def _load_trades(self) -> Iterator[ReplayEvent]:
         for file_path in self.trade_files:
-            frame = pd.read_csv(file_path)
+            frame = _read_frame(file_path)
             required = {"timestamp", "symbol", "price", "size", "side"}
             if not required.issubset(frame.columns):
                 raise ValueError(f"{file_path} missing required columns {required}")
@@ -108,7 +152,7 @@ class EventLoader:
 
     def _load_option_surfaces(self) -> Iterator[ReplayEvent]:
         for file_path in self.option_surface_files:
-            frame = pd.read_csv(file_path)
+            frame = _read_frame(file_path)
             required = {"timestamp", "symbol", "expiry", "strike", "right", "bid", "ask"}
             if not required.issubset(frame.columns):
                 raise ValueError(f"{file_path} missing required columns {required}")
@@ -5,14 +5,18 @@ from __future__ import annotations
 import asyncio
 from abc import abstractmethod
 from collections import deque
+from collections.abc import Sequence
 from contextlib import suppress
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
+import numpy.typing as npt
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from ibkr_trader._sma_kernel import sma_signals
 from ibkr_trader.base_strategy import BaseStrategy, BrokerProtocol
 from ibkr_trader.events import EventBus, EventSubscription, EventTopic, MarketDataEvent
 from ibkr_trader.models import OrderRequest, OrderSide, OrderType, SymbolContract
@@ -270,24 +274,67 @@ class SimpleMovingAverageStrategy(Strategy):
             symbol: deque(maxlen=self.config.slow_period) for symbol in config.symbols
         }
 
+        # Rolling window sums so each bar updates the SMAs in constant time
+        self._fast_sums: dict[str, Decimal] = {}
+        self._slow_sums: dict[str, Decimal] = {}
+
         # Track previous crossover state to detect changes
         self.prev_crossover: dict[str, bool | None] = dict.fromkeys(config.symbols)
 
-    def _calculate_sma(self, prices: deque[Decimal], period: int) -> Decimal | None:
-        """Calculate Simple Moving Average.
+    def _update_smas(self, symbol: str, price: Decimal) -> tuple[Decimal | None, Decimal | None]:
+        """Append a price and return the updated fast/slow SMAs.
 
         Args:
-            prices: Price history
-            period: SMA period
+            symbol: Trading symbol
+            price: Latest price
 
         Returns:
-            SMA value or None if insufficient data
+            (fast_sma, slow_sma), each None while its window is not yet full
         """
-        if len(prices) < period:
-            return None
+        history = self.price_history.get(symbol)
+        if history is None:
+            history = self.price_history[symbol] = deque(maxlen=self.config.slow_period)
+
+        fast_period = self.config.fast_period
+        slow_period = self.config.slow_period
+        fast_sum = self._fast_sums.get(symbol, Decimal("0")) + price
+        slow_sum = self._slow_sums.get(symbol, Decimal("0")) + price
+
+        # Drop the prices leaving each window before the deque evicts them
+        if len(history) >= fast_period:
+            fast_sum -= history[-fast_period]
+        if len(history) == slow_period:
+            slow_sum -= history[0]
+
+        history.append(price)
+        self._fast_sums[symbol] = fast_sum
+        self._slow_sums[symbol] = slow_sum
+
+        count = len(history)
+        fast_sma = fast_sum / fast_period if count >= fast_period else None
+        slow_sma = slow_sum / slow_period if count >= slow_period else None
+        return fast_sma, slow_sma
+
+    def run_batch(
+        self, prices: Sequence[Decimal | float] | npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.int8]:
+        """Compute crossover signals for a recorded price series in one pass.
+
+        Intended for replays/backtests over stored prices; live trading keeps using
+        ``on_bar``. Position checks and order submission are left to the caller.
 
-        recent_prices = list(prices)[-period:]
-        return sum(recent_prices) / Decimal(str(period))
+        Args:
+            prices: Price series for a single symbol, oldest first
+
+        Returns:
+            int8 array aligned with ``prices``: +1 bullish cross, -1 bearish cross, 0 none
+        """
+        values = (
+            prices
+            if isinstance(prices, np.ndarray)
+            else np.fromiter((float(price) for price in prices), dtype=np.float64)
+        )
+        return sma_signals(values, self.config.fast_period, self.config.slow_period)
 
     async def on_bar(
         self, symbol: str, price: Decimal, broker: BrokerProtocol, **kwargs: object
@@ -300,15 +347,7 @@ class SimpleMovingAverageStrategy(Strategy):
             broker: Broker instance for order submission
             **kwargs: Optional OHLC data (high, low, volume) - not used by SMA strategy
         """
-        # Update price history
-        if symbol not in self.price_history:
-            self.price_history[symbol] = deque(maxlen=self.config.slow_period)
-
-        self.price_history[symbol].append(price)
-
-        # Calculate SMAs
-        fast_sma = self._calculate_sma(self.price_history[symbol], self.config.fast_period)
-        slow_sma = self._calculate_sma(self.price_history[symbol], self.config.slow_period)
+        fast_sma, slow_sma = self._update_smas(symbol, price)
 
         # Need both SMAs to generate signals
         if fast_sma is None or slow_sma is None:
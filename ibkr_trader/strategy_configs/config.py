@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import ClassVar, Literal
+from typing import IO, ClassVar, Literal
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -56,8 +56,12 @@ class StrategyConfig(BaseModel):
 
     REGISTRY: ClassVar[dict[str, type[StrategyConfig]]] = {}
 
-    def dump_json(self, path: Path) -> None:
-        path.write_text(self.model_dump_json(indent=2))
+    def dump_json(self, path: Path | IO[bytes]) -> None:
+        payload = self.model_dump_json(indent=2)
+        if isinstance(path, Path):
+            path.write_text(payload)
+        else:
+            path.write(payload.encode())
 
     @classmethod
     def register(cls, config_type: type[StrategyConfig]) -> None:
@@ -67,12 +71,12 @@ class StrategyConfig(BaseModel):
         cls.REGISTRY[strategy_field.default] = config_type
 
     @classmethod
-    def load(cls, path: Path) -> StrategyConfig:
-        data = json.loads(path.read_text())
+    def load(cls, path: Path | IO[bytes]) -> StrategyConfig:
+        data = json.loads(path.read_text() if isinstance(path, Path) else path.read())
         strategy_type = data.get("strategy_type")
-        if strategy_type not in cls.REGISTRY:
+        config_cls = cls.REGISTRY.get(strategy_type)
+        if config_cls is None:
             raise ValueError(f"Unknown strategy_type '{strategy_type}'")
-        config_cls = cls.REGISTRY[strategy_type]
         try:
             return config_cls.model_validate(data)
         except ValidationError as exc:
@@ -1,12 +1,18 @@
 """Compatibility shim for ibkr_trader.trailing_stops."""
 
 from ibkr_trader.execution.trailing_stops import (
+    FileStateStore,
+    MemoryStateStore,
+    StateStore,
     TrailingStop,
     TrailingStopConfig,
     TrailingStopManager,
 )
 
 __all__ = [
+    "FileStateStore",
+    "MemoryStateStore",
+    "StateStore",
     "TrailingStopConfig",
     "TrailingStop",
     "TrailingStopManager",
@@ -18,4 +18,16 @@ uv run ruff check ibkr_trader tests
 echo "[linter] Running syntax check"
 uv run python -m compileall ibkr_trader tests >/dev/null
 
+echo "[linter] Checking for duplicate test IDs"
+# Reset addopts: its -q stacks with ours into -qq, which hides node IDs.
+DUPLICATE_TESTS="$(
+  uv run pytest --collect-only -q -o addopts="" -p no:cacheprovider \
+    | { grep '::' || true; } | sort | uniq -d
+)"
+if [[ -n "$DUPLICATE_TESTS" ]]; then
+  echo "[linter] Duplicate test IDs collected:" >&2
+  echo "$DUPLICATE_TESTS" >&2
+  exit 1
+fi
+
 echo "[linter] All checks passed"
@@ -8,7 +8,7 @@ manipulation so they can be reused both in production code and tests.
 
 from __future__ import annotations
 
-from .cache_store import FileCacheStore
+from .cache_store import FileCacheStore, LRUCacheStore
 from .client import MarketDataClient
 from .ibkr import IBKRMarketDataSource, IBKROptionChainSource, SnapshotLimitError
 from .options import (
@@ -25,6 +25,7 @@ from .sources import (
 
 __all__ = [
     "FileCacheStore",
+    "LRUCacheStore",
     "MarketDataClient",
     "IBKRMarketDataSource",
     "IBKROptionChainSource",
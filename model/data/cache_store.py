@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import threading
 import time
+from collections import OrderedDict
+from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Protocol
 
 import pandas as pd
 
@@ -17,6 +20,16 @@ from .utils import file_lock, write_csv_atomic
 logger = logging.getLogger(__name__)
 
 
+class PriceBarCache(Protocol):
+    """Protocol implemented by price bar cache stores."""
+
+    def load_price_bars(self, request: PriceBarRequest) -> pd.DataFrame | None:
+        """Return cached bars for ``request`` or ``None`` on a miss."""
+
+    def store_price_bars(self, request: PriceBarRequest, frame: pd.DataFrame) -> object:
+        """Cache bars fetched for ``request``."""
+
+
 class FileCacheStore:
     """Persist price bar data frames to disk for reuse."""
 
@@ -99,3 +112,63 @@ class FileCacheStore:
                     "Price cache entry nearing TTL",
                     {"path": str(path), "age_seconds": age, "ttl_seconds": self._ttl_seconds},
                 )
+
+
+class LRUCacheStore:
+    """Keep recently used price bar frames in memory, optionally in front of another store.
+
+    Hits skip CSV parsing entirely, which matters when the same symbols are requested
+    repeatedly in one process (e.g. while iterating model hyperparameters). Entries live
+    for the lifetime of the store; TTLs only apply to the backing store.
+    """
+
+    def __init__(self, capacity: int = 64, *, backing: PriceBarCache | None = None) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._capacity = capacity
+        self._backing = backing
+        self._frames: OrderedDict[tuple[str, datetime, datetime, str, bool], pd.DataFrame] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def load_price_bars(self, request: PriceBarRequest) -> pd.DataFrame | None:
+        key = self._key_for_request(request)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                logger.debug("Memory cache hit for %s", request.symbol)
+                return frame
+        if self._backing is None:
+            return None
+        frame = self._backing.load_price_bars(request)
+        if frame is not None:
+            self._remember(key, frame)
+        return frame
+
+    def store_price_bars(self, request: PriceBarRequest, frame: pd.DataFrame) -> None:
+        if self._backing is not None:
+            self._backing.store_price_bars(request, frame)
+        self._remember(self._key_for_request(request), frame)
+
+    def _remember(
+        self, key: tuple[str, datetime, datetime, str, bool], frame: pd.DataFrame
+    ) -> None:
+        with self._lock:
+            self._frames[key] = frame
+            self._frames.move_to_end(key)
+            while len(self._frames) > self._capacity:
+                self._frames.popitem(last=False)
+
+    @staticmethod
+    def _key_for_request(
+        request: PriceBarRequest,
+    ) -> tuple[str, datetime, datetime, str, bool]:
+        return (
+            request.symbol.upper(),
+            request.start,
+            request.end,
+            request.interval,
+            request.auto_adjust,
+        )
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
 
 import pandas as pd
 
-from .cache_store import FileCacheStore
+from .cache_store import PriceBarCache
 from .market_data import MarketDataSource, PriceBarRequest, normalize_price_columns
 
 logger = logging.getLogger(__name__)
@@ -22,7 +23,7 @@ class MarketDataClient:
         self,
         *,
         source: MarketDataSource,
-        cache: FileCacheStore | None = None,
+        cache: PriceBarCache | None = None,
         normalizer: Callable[[pd.DataFrame], pd.DataFrame] | None = DEFAULT_NORMALIZER,
     ) -> None:
         self._source = source
@@ -47,3 +48,17 @@ class MarketDataClient:
             logger.debug("Fetched price bars without cache for %s (rows=%d)", request_label, len(frame))
 
         return frame.copy()
+
+    def get_price_bars_many(
+        self, requests: Iterable[PriceBarRequest], *, max_workers: int | None = None
+    ) -> list[pd.DataFrame]:
+        """Fetch several requests concurrently, returning frames in request order.
+
+        Source downloads are network bound, so cache misses are resolved on a thread pool
+        rather than one after another.
+        """
+        pending = list(requests)
+        if len(pending) <= 1:
+            return [self.get_price_bars(request) for request in pending]
+        with ThreadPoolExecutor(max_workers=max_workers or len(pending)) as pool:
+            return list(pool.map(self.get_price_bars, pending))
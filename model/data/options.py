@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
 import time
 from dataclasses import dataclass
@@ -11,6 +10,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
+import orjson
 import pandas as pd
 
 from .constants import (
@@ -133,11 +133,11 @@ class OptionChainCacheStore:
         if self._max_age_seconds is None:
             return False
         try:
-            with metadata_path.open("r", encoding="utf-8") as handle:
-                metadata = json.load(handle)
+            metadata = orjson.loads(metadata_path.read_bytes())
             stored_at = float(metadata.get("stored_at", 0.0))
             schema_version = metadata.get("schema_version")
-        except (FileNotFoundError, json.JSONDecodeError, ValueError):  # pragma: no cover
+        # ValueError covers a malformed stored_at, as with the stdlib reader before.
+        except (FileNotFoundError, orjson.JSONDecodeError, ValueError):  # pragma: no cover
             return True
         if schema_version != OPTION_CHAIN_SCHEMA_VERSION:
             logger.debug(
@@ -160,9 +160,8 @@ class OptionChainCacheStore:
         entries: list[dict[str, Any]] = []
         for metadata_path in self._base_dir.glob(f"**/{OPTION_CHAIN_METADATA_FILENAME}"):
             try:
-                with metadata_path.open("r", encoding="utf-8") as handle:
-                    metadata = json.load(handle)
-            except (FileNotFoundError, json.JSONDecodeError):  # pragma: no cover
+                metadata = orjson.loads(metadata_path.read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError):  # pragma: no cover
                 continue
             symbol = metadata.get("symbol") or metadata_path.parent.parent.name.upper()
             expiry = metadata.get("expiry") or metadata_path.parent.name
@@ -212,9 +211,8 @@ class OptionChainCacheStore:
     @staticmethod
     def _age_seconds(metadata_path: Path) -> float | None:
         try:
-            with metadata_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
-        except (FileNotFoundError, json.JSONDecodeError):  # pragma: no cover
+            payload = orjson.loads(metadata_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):  # pragma: no cover
             return None
         stored_at = payload.get("stored_at")
         if not isinstance(stored_at, (int, float)):
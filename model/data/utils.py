@@ -8,6 +8,7 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
+import orjson
 import pandas as pd
 
 from .constants import LOCK_SUFFIX, TEMP_SUFFIX
@@ -57,10 +58,7 @@ def write_csv_atomic(path: Path, frame: pd.DataFrame, *, index: bool = False) ->
 def write_json_atomic(path: Path, payload: dict) -> None:
     """Persist JSON payload to ``path`` atomically."""
 
-    import json
-
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_suffix(path.suffix + TEMP_SUFFIX)
-    with temp_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
+    temp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
     temp_path.replace(path)
@@ -84,20 +84,22 @@ def _download_prices(
         frames: list[pd.Series] = []
         start_dt = datetime.fromisoformat(start).replace(tzinfo=UTC)
         end_dt = datetime.fromisoformat(end).replace(tzinfo=UTC)
-        for symbol in symbols:
-            request = PriceBarRequest(
+        requests = [
+            PriceBarRequest(
                 symbol=symbol,
                 start=start_dt,
                 end=end_dt,
                 interval="1d",
                 auto_adjust=False,
             )
-            frame = data_client.get_price_bars(request)
+            for symbol in symbols
+        ]
+        for request, frame in zip(requests, data_client.get_price_bars_many(requests), strict=True):
             candidate_col = next((name for name in ("adj_close", "close") if name in frame.columns), None)
             if candidate_col is None:
                 available = frame.columns.tolist()
                 raise KeyError(f"Expected 'adj_close' or 'close' columns; got {available}")
-            series = frame[candidate_col].rename(symbol)
+            series = frame[candidate_col].rename(request.symbol)
             frames.append(series)
         data = pd.concat(frames, axis=1)
 
@@ -2,9 +2,31 @@
 
 from __future__ import annotations
 
+from asyncio import AbstractEventLoop
+from collections.abc import Callable, Iterator, Mapping
+from decimal import Decimal
+
 import pytest
 from loguru import logger
 
+from ibkr_trader.events import EventBus
+from ibkr_trader.models import OrderSide, Position, SymbolContract, TrailingStopConfig
+from ibkr_trader.sim.broker import SimulatedBroker
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> Mapping[str, Callable[[], AbstractEventLoop]]:
+        """Run async tests on uvloop where it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
 
 @pytest.fixture(scope="session", autouse=True)
 def silence_loguru_handlers() -> None:
@@ -12,3 +34,62 @@ def silence_loguru_handlers() -> None:
     logger.remove()
     logger.add(lambda _: None, catch=True)
     yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_model_validators() -> None:
+    """Run one validation per hot model up front.
+
+    Pydantic compiles schemas at import, but the first validation still pays one-off
+    setup; doing it here keeps that cost out of whichever test happens to run first.
+    """
+    TrailingStopConfig(symbol="AAPL", side=OrderSide.SELL, quantity=1, trail_amount=Decimal("1"))
+
+
+@pytest.fixture(scope="session")
+def make_position() -> Callable[[str, int, Decimal], Position]:
+    """Factory building ``Position`` fixtures without re-running Pydantic validation.
+
+    The schema is validated once per session; subsequent positions use ``model_construct``
+    since test inputs are already correctly typed. Contracts are copied from one validated
+    template so their defaults always match ``SymbolContract``.
+    """
+    contract_template = SymbolContract(symbol="AAPL")
+    if __debug__:
+        Position(
+            contract=contract_template,
+            quantity=1,
+            avg_cost=Decimal("1"),
+            market_value=Decimal("1"),
+            unrealized_pnl=Decimal("0"),
+        )
+
+    def _mkpos(symbol: str, quantity: int, price: Decimal) -> Position:
+        return Position.model_construct(
+            contract=contract_template.model_copy(update={"symbol": symbol}),
+            quantity=quantity,
+            avg_cost=price,
+            market_value=price * quantity,
+            unrealized_pnl=Decimal("0"),
+            realized_pnl=Decimal("0"),
+        )
+
+    return _mkpos
+
+
+@pytest.fixture(scope="session")
+def _session_event_bus() -> EventBus:
+    return EventBus()
+
+
+@pytest.fixture
+def event_bus(_session_event_bus: EventBus) -> Iterator[EventBus]:
+    """Event bus shared across the session, with subscribers dropped after each test."""
+    yield _session_event_bus
+    _session_event_bus.reset()
+
+
+@pytest.fixture
+def broker(event_bus: EventBus) -> SimulatedBroker:
+    """Fresh simulated broker publishing onto the shared event bus."""
+    return SimulatedBroker(event_bus=event_bus)
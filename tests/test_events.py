@@ -61,3 +61,27 @@ async def test_multiple_subscribers_receive_same_event() -> None:
 
     sub_a.close()
     sub_b.close()
+
+
+@pytest.mark.asyncio
+async def test_event_bus_reset_drops_subscribers() -> None:
+    bus = EventBus()
+    subscription = bus.subscribe(EventTopic.ORDER_STATUS)
+
+    bus.reset()
+    await bus.publish(EventTopic.ORDER_STATUS, "ignored")
+
+    assert subscription._queue.empty()
+    subscription.close()
+
+
+@pytest.mark.asyncio
+async def test_event_bus_publish_many_preserves_order() -> None:
+    bus = EventBus()
+    subscription = bus.subscribe(EventTopic.DIAGNOSTIC)
+
+    await bus.publish_many(EventTopic.DIAGNOSTIC, ["first", "second", "third"])
+
+    received = [await asyncio.wait_for(subscription.get(), timeout=0.1) for _ in range(3)]
+    assert received == ["first", "second", "third"]
+    subscription.close()
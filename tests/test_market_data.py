@@ -10,7 +10,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from model.data.cache_store import FileCacheStore
+from model.data.cache_store import FileCacheStore, LRUCacheStore
 from model.data.client import MarketDataClient
 from model.data.market_data import MarketDataSource, PriceBarRequest
 from model.data.sources import YFinanceMarketDataSource
@@ -66,6 +66,67 @@ def test_market_data_client_uses_cache(tmp_path: Path) -> None:
     pd.testing.assert_frame_equal(result_second, frame, check_freq=False)
 
 
+def test_lru_cache_store_evicts_least_recently_used() -> None:
+    cache = LRUCacheStore(capacity=2)
+    requests = {
+        symbol: PriceBarRequest(
+            symbol=symbol,
+            start=datetime(2024, 1, 1, tzinfo=UTC),
+            end=datetime(2024, 1, 4, tzinfo=UTC),
+        )
+        for symbol in ("AAPL", "MSFT", "GOOG")
+    }
+    frame = sample_frame()
+
+    cache.store_price_bars(requests["AAPL"], frame)
+    cache.store_price_bars(requests["MSFT"], frame)
+    assert cache.load_price_bars(requests["AAPL"]) is frame
+    cache.store_price_bars(requests["GOOG"], frame)
+
+    assert cache.load_price_bars(requests["MSFT"]) is None
+    assert cache.load_price_bars(requests["AAPL"]) is frame
+    assert cache.load_price_bars(requests["GOOG"]) is frame
+
+
+def test_lru_cache_store_reads_through_backing_store(tmp_path: Path) -> None:
+    request = PriceBarRequest(
+        symbol="MSFT",
+        start=datetime(2024, 2, 1, tzinfo=UTC),
+        end=datetime(2024, 2, 3, tzinfo=UTC),
+    )
+    backing = FileCacheStore(tmp_path)
+    backing.store_price_bars(request, sample_frame())
+    cache = LRUCacheStore(capacity=4, backing=backing)
+
+    first = cache.load_price_bars(request)
+    second = cache.load_price_bars(request)
+
+    assert first is not None
+    assert second is first
+
+
+def test_market_data_client_fetches_many_in_request_order() -> None:
+    requests = [
+        PriceBarRequest(
+            symbol=symbol,
+            start=datetime(2024, 2, 1, tzinfo=UTC),
+            end=datetime(2024, 2, 3, tzinfo=UTC),
+        )
+        for symbol in ("AAPL", "MSFT", "GOOG")
+    ]
+    frame = sample_frame()
+    source = DummySource(frame)
+    client = MarketDataClient(source=source, cache=LRUCacheStore())
+
+    first = client.get_price_bars_many(requests)
+    second = client.get_price_bars_many(requests)
+
+    assert len(first) == len(second) == 3
+    assert source.calls == 3
+    for result in (*first, *second):
+        pd.testing.assert_frame_equal(result, frame, check_freq=False)
+
+
 def test_yfinance_source_normalizes_columns(monkeypatch: pytest.MonkeyPatch) -> None:
     request = PriceBarRequest(
         symbol="GOOG",
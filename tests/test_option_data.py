@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import time
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
 
+import orjson
 import pandas as pd
 import pytest
 
@@ -21,6 +21,9 @@ from model.data.options import (
 )
 from model.data.sources import YFinanceOptionChainSource
 
+_EXPIRY = datetime(2024, 1, 19, tzinfo=UTC)
+_REQ_AAPL = OptionChainRequest(symbol="AAPL", expiry=_EXPIRY)
+
 
 def sample_chain() -> OptionChain:
     calls = pd.DataFrame(
@@ -40,13 +43,18 @@ def sample_chain() -> OptionChain:
     return OptionChain(calls=calls, puts=puts)
 
 
-def test_option_chain_cache_roundtrip(tmp_path: Path) -> None:
-    cache = OptionChainCacheStore(tmp_path)
-    request = OptionChainRequest(symbol="AAPL", expiry=datetime(2024, 1, 19, tzinfo=UTC))
+@pytest.fixture(scope="module")
+def shared_cache(tmp_path_factory: pytest.TempPathFactory) -> OptionChainCacheStore:
+    """Single cache store reused by tests that key their requests by unique symbols."""
+    return OptionChainCacheStore(tmp_path_factory.mktemp("chains"))
+
+
+def test_option_chain_cache_roundtrip(shared_cache: OptionChainCacheStore) -> None:
+    request = OptionChainRequest(symbol="AAPL_RT", expiry=_EXPIRY)
     chain = sample_chain()
 
-    cache.store_option_chain(request, chain)
-    reloaded = cache.load_option_chain(request)
+    shared_cache.store_option_chain(request, chain)
+    reloaded = shared_cache.load_option_chain(request)
 
     assert reloaded is not None
     pd.testing.assert_frame_equal(reloaded.calls, chain.calls)
@@ -63,12 +71,11 @@ class DummyOptionSource(OptionChainSource):
         return self.chain
 
 
-def test_option_chain_client_uses_cache(tmp_path: Path) -> None:
+def test_option_chain_client_uses_cache(shared_cache: OptionChainCacheStore) -> None:
     chain = sample_chain()
     source = DummyOptionSource(chain)
-    cache = OptionChainCacheStore(tmp_path)
-    client = OptionChainClient(source=source, cache=cache)
-    request = OptionChainRequest(symbol="AAPL", expiry=datetime(2024, 1, 19, tzinfo=UTC))
+    client = OptionChainClient(source=source, cache=shared_cache)
+    request = OptionChainRequest(symbol="AAPL_CLIENT", expiry=_EXPIRY)
 
     first = client.get_option_chain(request)
     second = client.get_option_chain(request)
@@ -78,48 +85,53 @@ def test_option_chain_client_uses_cache(tmp_path: Path) -> None:
     pd.testing.assert_frame_equal(second.puts, chain.puts)
 
 
-def test_yfinance_option_chain_source(monkeypatch: pytest.MonkeyPatch) -> None:
-    chain = sample_chain()
-    fake_chain = SimpleNamespace(calls=chain.calls, puts=chain.puts)
+class FakeTicker:
+    """Stand-in for ``yfinance.Ticker`` serving a fixed option chain."""
 
-    class FakeTicker:
-        def __init__(self, symbol: str) -> None:
-            self.symbol = symbol
+    expected_expiry = "2024-01-19"
+    chain: SimpleNamespace | None = None
 
-        def option_chain(self, expiry: str) -> SimpleNamespace:
-            assert expiry == "2024-01-19"
-            return fake_chain
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
 
+    def option_chain(self, expiry: str) -> SimpleNamespace:
+        assert expiry == self.expected_expiry
+        assert self.chain is not None
+        return self.chain
+
+
+def test_yfinance_option_chain_source(monkeypatch: pytest.MonkeyPatch) -> None:
+    chain = sample_chain()
+    monkeypatch.setattr(FakeTicker, "chain", SimpleNamespace(calls=chain.calls, puts=chain.puts))
     monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     source = YFinanceOptionChainSource()
-    request = OptionChainRequest(symbol="AAPL", expiry=datetime(2024, 1, 19, tzinfo=UTC))
-    result = source.get_option_chain(request)
+    result = source.get_option_chain(_REQ_AAPL)
 
-    pd.testing.assert_frame_equal(result.calls, chain.calls)
-    pd.testing.assert_frame_equal(result.puts, chain.puts)
+    # The source copies the frames, so compare values rather than identity.
+    assert result.calls.equals(chain.calls)
+    assert result.puts.equals(chain.puts)
 
 
 def test_option_chain_cache_ttl(tmp_path: Path) -> None:
     cache = OptionChainCacheStore(tmp_path, max_age_seconds=60)
-    request = OptionChainRequest(symbol="AAPL", expiry=datetime(2024, 1, 19, tzinfo=UTC))
     chain = sample_chain()
 
-    calls_path, _ = cache.store_option_chain(request, chain)
+    calls_path, _ = cache.store_option_chain(_REQ_AAPL, chain)
     metadata_path = calls_path.parent / OPTION_CHAIN_METADATA_FILENAME
-    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    # Expiry is driven by the stored_at field, not file mtime, so rewrite the metadata.
+    metadata = orjson.loads(metadata_path.read_bytes())
     metadata["stored_at"] = time.time() - 3600
-    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    metadata_path.write_bytes(orjson.dumps(metadata))
 
-    assert cache.load_option_chain(request) is None
+    assert cache.load_option_chain(_REQ_AAPL) is None
 
 
-def test_option_chain_metadata_entries(tmp_path: Path) -> None:
-    cache = OptionChainCacheStore(tmp_path)
-    request = OptionChainRequest(symbol="AAPL", expiry=datetime(2024, 1, 19, tzinfo=UTC))
+def test_option_chain_metadata_entries(shared_cache: OptionChainCacheStore) -> None:
+    request = OptionChainRequest(symbol="AAPL_META", expiry=_EXPIRY)
     chain = sample_chain()
-    cache.store_option_chain(request, chain)
+    shared_cache.store_option_chain(request, chain)
 
-    entries = cache.metadata_entries()
+    entries = shared_cache.metadata_entries()
     assert entries, "Expected metadata entries to be reported"
-    assert any(entry["symbol"] == "AAPL" for entry in entries)
+    assert any(entry["symbol"] == "AAPL_META" for entry in entries)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
@@ -15,7 +16,9 @@ from ibkr_trader.risk import FeeConfig
 
 
 @pytest.mark.asyncio
-async def test_portfolio_updates_account_and_positions() -> None:
+async def test_portfolio_updates_account_and_positions(
+    make_position: Callable[[str, int, Decimal], Position],
+) -> None:
     state = PortfolioState(max_daily_loss=Decimal("1000"))
     await state.update_account(
         {
@@ -25,15 +28,7 @@ async def test_portfolio_updates_account_and_positions() -> None:
         }
     )
 
-    positions = [
-        Position(
-            contract=SymbolContract(symbol="AAPL"),
-            quantity=10,
-            avg_cost=Decimal("150"),
-            market_value=Decimal("1500"),
-            unrealized_pnl=Decimal("100"),
-        )
-    ]
+    positions = [make_position("AAPL", 10, Decimal("150"))]
 
     await state.update_positions(positions)
 
@@ -1,7 +1,6 @@
 """Tests for fee-aware RiskGuard validation."""
 
 from decimal import Decimal
-from pathlib import Path
 
 import pytest
 
@@ -9,19 +8,25 @@ from ibkr_trader.models import OrderSide, SymbolContract
 from ibkr_trader.risk import FeeConfig, PortfolioState, RiskGuard
 from ibkr_trader.risk.fees import CommissionProfile, SlippageEstimate
 
+_AAPL_STK = SymbolContract(symbol="AAPL", sec_type="STK")
+_EUR_CASH = SymbolContract(symbol="EUR", sec_type="CASH", exchange="IDEALPRO", currency="USD")
 
-@pytest.fixture
-def portfolio_state(tmp_path: Path) -> PortfolioState:
-    """Create a portfolio state for testing."""
+
+@pytest.fixture(scope="module")
+def portfolio_state(tmp_path_factory: pytest.TempPathFactory) -> PortfolioState:
+    """Create a portfolio state shared by the module.
+
+    RiskGuard.validate_order only reads portfolio state, so the tests can reuse one instance.
+    """
     return PortfolioState(
         max_daily_loss=Decimal("1000"),
-        snapshot_path=tmp_path / "portfolio.json",
+        snapshot_path=tmp_path_factory.mktemp("portfolio") / "portfolio.json",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fee_config() -> FeeConfig:
-    """Create a fee configuration for testing."""
+    """Create a fee configuration shared by the module."""
     return FeeConfig(
         stock_commission=CommissionProfile(
             per_share=Decimal("0.005"),
@@ -42,11 +47,9 @@ async def test_risk_guard_without_fees(portfolio_state: PortfolioState) -> None:
         fee_config=None,  # No fees
     )
 
-    contract = SymbolContract(symbol="AAPL", sec_type="STK")
-
     # Order exposure: 100 * 50 = 5000 (within limit)
     await guard.validate_order(
-        contract=contract,
+        contract=_AAPL_STK,
         side=OrderSide.BUY,
         quantity=100,
         price=Decimal("50"),
@@ -64,14 +67,12 @@ async def test_risk_guard_with_fees_within_limit(
         fee_config=fee_config,
     )
 
-    contract = SymbolContract(symbol="AAPL", sec_type="STK")
-
     # Base exposure: 100 * 50 = 5000
     # Commission: 1.00 (minimum)
     # Slippage: 5000 * 0.0005 = 2.50
     # Total: 5003.50 (within 10000 limit)
     await guard.validate_order(
-        contract=contract,
+        contract=_AAPL_STK,
         side=OrderSide.BUY,
         quantity=100,
         price=Decimal("50"),
@@ -89,15 +90,13 @@ async def test_risk_guard_with_fees_exceeds_limit(
         fee_config=fee_config,
     )
 
-    contract = SymbolContract(symbol="AAPL", sec_type="STK")
-
     # Base exposure: 100 * 50 = 5000
     # Commission: 1.00
     # Slippage: 2.50
     # Total: 5003.50 (exceeds 5000 limit)
     with pytest.raises(RuntimeError, match="Order exposure.*exceeds max exposure"):
         await guard.validate_order(
-            contract=contract,
+            contract=_AAPL_STK,
             side=OrderSide.BUY,
             quantity=100,
             price=Decimal("50"),
@@ -115,14 +114,12 @@ async def test_risk_guard_large_order_with_fees(
         fee_config=fee_config,
     )
 
-    contract = SymbolContract(symbol="AAPL", sec_type="STK")
-
     # Base exposure: 1000 * 75 = 75000
     # Commission: 1000 * 0.005 = 5.00
     # Slippage: 75000 * 0.0005 = 37.50
     # Total: 75042.50 (within 100000 limit)
     await guard.validate_order(
-        contract=contract,
+        contract=_AAPL_STK,
         side=OrderSide.BUY,
         quantity=1000,
         price=Decimal("75"),
@@ -143,19 +140,12 @@ async def test_risk_guard_forex_with_fees(portfolio_state: PortfolioState) -> No
         fee_config=fx_config,
     )
 
-    contract = SymbolContract(
-        symbol="EUR",
-        sec_type="CASH",
-        exchange="IDEALPRO",
-        currency="USD",
-    )
-
     # Base exposure: 10000 * 1.10 = 11000
     # Commission: 11000 * 0.00002 = 0.22
     # Slippage: 11000 * 0.0001 = 1.10
     # Total: 11001.32 (within 15000 limit)
     await guard.validate_order(
-        contract=contract,
+        contract=_EUR_CASH,
         side=OrderSide.BUY,
         quantity=10000,
         price=Decimal("1.10"),
@@ -201,11 +191,9 @@ async def test_risk_guard_fees_with_zero_price(
         fee_config=fee_config,
     )
 
-    contract = SymbolContract(symbol="AAPL", sec_type="STK")
-
     # Should not raise despite low limit (price is 0)
     await guard.validate_order(
-        contract=contract,
+        contract=_AAPL_STK,
         side=OrderSide.BUY,
         quantity=10000,
         price=Decimal("0"),
@@ -223,12 +211,10 @@ async def test_risk_guard_sell_order_with_fees(
         fee_config=fee_config,
     )
 
-    contract = SymbolContract(symbol="AAPL", sec_type="STK")
-
     # Base exposure: 100 * 50 = 5000
     # Fees apply to both buy and sell
     await guard.validate_order(
-        contract=contract,
+        contract=_AAPL_STK,
         side=OrderSide.SELL,
         quantity=100,
         price=Decimal("50"),
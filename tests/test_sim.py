@@ -13,11 +13,8 @@ from ibkr_trader.sim.broker import SimulatedBroker
 
 
 @pytest.mark.asyncio
-async def test_simulated_broker_places_order() -> None:
-    bus = EventBus()
-    broker = SimulatedBroker(event_bus=bus)
-    status_sub = bus.subscribe(EventTopic.ORDER_STATUS)
-    exec_sub = bus.subscribe(EventTopic.EXECUTION)
+async def test_simulated_broker_places_order(event_bus: EventBus) -> None:
+    broker = SimulatedBroker(event_bus=event_bus)
 
     request = OrderRequest(
         contract=SymbolContract(symbol="AAPL"),
@@ -27,10 +24,15 @@ async def test_simulated_broker_places_order() -> None:
         expected_price=Decimal("150"),
     )
 
-    result = await broker.place_order(request)
+    async with (
+        event_bus.subscribe(EventTopic.ORDER_STATUS) as status_sub,
+        event_bus.subscribe(EventTopic.EXECUTION) as exec_sub,
+    ):
+        result = await broker.place_order(request)
 
-    status = await asyncio.wait_for(status_sub.get(), timeout=0.1)
-    execution = await asyncio.wait_for(exec_sub.get(), timeout=0.1)
+        status, execution = await asyncio.wait_for(
+            asyncio.gather(status_sub.get(), exec_sub.get()), timeout=0.2
+        )
 
     assert result.status == OrderStatus.FILLED
     assert status.order_id == execution.order_id
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 from model.data.models import OrderBookSnapshot
@@ -24,6 +25,46 @@ def _write_csv(path: Path, frame: pd.DataFrame) -> None:
     frame.to_csv(path, index=False)
 
 
+_ORDER_BOOK_ROWS = [
+    {
+        "timestamp": "2024-01-01T14:00:00+00:00",
+        "symbol": "AAPL",
+        "side": "bid",
+        "price": 199.5,
+        "size": 100,
+        "level": 1,
+    },
+    {
+        "timestamp": "2024-01-01T14:00:00+00:00",
+        "symbol": "AAPL",
+        "side": "ask",
+        "price": 200.5,
+        "size": 100,
+        "level": 1,
+    },
+]
+
+_ORDER_BOOK_ARRAY = np.rec.fromrecords(
+    [tuple(row.values()) for row in _ORDER_BOOK_ROWS],
+    dtype=[
+        ("timestamp", "U25"),
+        ("symbol", "U8"),
+        ("side", "U3"),
+        ("price", "f8"),
+        ("size", "f8"),
+        ("level", "i4"),
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def orderbook_feather_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the canonical one-snapshot AAPL order book once as an Arrow IPC file."""
+    path = tmp_path_factory.mktemp("orderbook") / "orderbook.feather"
+    pd.DataFrame(_ORDER_BOOK_ROWS).to_feather(path)
+    return path
+
+
 def test_event_loader_merges_streams(tmp_path: Path) -> None:
     order_book_path = tmp_path / "orderbook.csv"
     trade_path = tmp_path / "trades.csv"
@@ -31,26 +72,7 @@ def test_event_loader_merges_streams(tmp_path: Path) -> None:
 
     _write_csv(
         order_book_path,
-        pd.DataFrame(
-            [
-                {
-                    "timestamp": "2024-01-01T14:00:00+00:00",
-                    "symbol": "AAPL",
-                    "side": "bid",
-                    "price": 199.5,
-                    "size": 100,
-                    "level": 1,
-                },
-                {
-                    "timestamp": "2024-01-01T14:00:00+00:00",
-                    "symbol": "AAPL",
-                    "side": "ask",
-                    "price": 200.5,
-                    "size": 120,
-                    "level": 1,
-                },
-            ]
-        ),
+        pd.DataFrame([_ORDER_BOOK_ROWS[0], {**_ORDER_BOOK_ROWS[1], "size": 120}]),
     )
 
     _write_csv(
@@ -99,9 +121,8 @@ def test_event_loader_merges_streams(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_mock_broker_publish_fill() -> None:
-    bus = EventBus()
-    broker = MockBroker(bus)
+async def test_mock_broker_publish_fill(event_bus: EventBus) -> None:
+    broker = MockBroker(event_bus)
 
     order_request = OrderRequest(
         contract=SymbolContract(symbol="AAPL"),
@@ -114,7 +135,7 @@ async def test_mock_broker_publish_fill() -> None:
     result = await broker.submit_limit_order(order_request)
     assert result.status == OrderStatus.SUBMITTED
 
-    async with bus.subscribe(EventTopic.EXECUTION) as sub:
+    async with event_bus.subscribe(EventTopic.EXECUTION) as sub:
         await broker.simulate_fill(
             order_id=result.order_id,
             fill_quantity=1,
@@ -128,24 +149,7 @@ async def test_mock_broker_publish_fill() -> None:
 
 
 @pytest.mark.asyncio
-async def test_replay_runner_dispatches_events(tmp_path: Path) -> None:
-    order_book_path = tmp_path / "orderbook.csv"
-    _write_csv(
-        order_book_path,
-        pd.DataFrame(
-            [
-                {
-                    "timestamp": "2024-01-01T14:00:00+00:00",
-                    "symbol": "AAPL",
-                    "side": "bid",
-                    "price": 199.5,
-                    "size": 100,
-                    "level": 1,
-                }
-            ]
-        ),
-    )
-
+async def test_replay_runner_dispatches_events() -> None:
     class RecordingStrategy(ReplayStrategy):
         def __init__(self) -> None:
             self.order_book_events: list[str] = []
@@ -154,7 +158,7 @@ async def test_replay_runner_dispatches_events(tmp_path: Path) -> None:
             self.order_book_events.append(snapshot.symbol)
 
     strategy = RecordingStrategy()
-    loader = EventLoader(order_book_files=[order_book_path])
+    loader = EventLoader.from_arrays(order_book=_ORDER_BOOK_ARRAY)
     runner = ReplayRunner(loader=loader, strategy=strategy)
 
     await runner.run()
@@ -163,32 +167,7 @@ async def test_replay_runner_dispatches_events(tmp_path: Path) -> None:
 
 
 @pytest.mark.asyncio
-async def test_fixed_spread_strategy_quotes_and_updates_inventory(tmp_path: Path) -> None:
-    order_book_path = tmp_path / "orderbook.csv"
-    _write_csv(
-        order_book_path,
-        pd.DataFrame(
-            [
-                {
-                    "timestamp": "2024-01-01T14:00:00+00:00",
-                    "symbol": "AAPL",
-                    "side": "bid",
-                    "price": 199.5,
-                    "size": 100,
-                    "level": 1,
-                },
-                {
-                    "timestamp": "2024-01-01T14:00:00+00:00",
-                    "symbol": "AAPL",
-                    "side": "ask",
-                    "price": 200.5,
-                    "size": 100,
-                    "level": 1,
-                },
-            ]
-        ),
-    )
-
+async def test_fixed_spread_strategy_quotes_and_updates_inventory() -> None:
     class AutoFillStrategy(FixedSpreadMMStrategy):
         async def on_order_book(self, snapshot: OrderBookSnapshot, broker: MockBroker) -> None:  # type: ignore[override]
             await super().on_order_book(snapshot, broker)
@@ -201,7 +180,7 @@ async def test_fixed_spread_strategy_quotes_and_updates_inventory(tmp_path: Path
                 )
 
     strategy = AutoFillStrategy(symbol="AAPL", quote_size=1, spread=0.2, inventory_limit=2)
-    loader = EventLoader(order_book_files=[order_book_path])
+    loader = EventLoader.from_arrays(order_book=_ORDER_BOOK_ARRAY)
     runner = ReplayRunner(loader=loader, strategy=strategy)
 
     await runner.run()
@@ -209,3 +188,18 @@ async def test_fixed_spread_strategy_quotes_and_updates_inventory(tmp_path: Path
     assert strategy.active_bid_id is not None
     assert strategy.active_ask_id is not None
     assert strategy.inventory == 1
+
+
+def test_event_loader_from_arrays_matches_file_loader(orderbook_feather_path: Path) -> None:
+    from_file = list(EventLoader(order_book_files=[orderbook_feather_path]).load_events())
+    from_array = list(EventLoader.from_arrays(order_book=_ORDER_BOOK_ARRAY).load_events())
+
+    assert [event.timestamp for event in from_array] == [event.timestamp for event in from_file]
+    assert [event.payload for event in from_array] == [event.payload for event in from_file]
+
+
+def test_event_loader_from_arrays_requires_order_book_fields() -> None:
+    incomplete = np.rec.fromrecords([("AAPL", 1.0)], names=["symbol", "price"])
+
+    with pytest.raises(ValueError, match="missing required fields"):
+        EventLoader.from_arrays(order_book=incomplete)
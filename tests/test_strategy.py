@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import random
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from decimal import Decimal
+from types import MappingProxyType
 
 import pytest
 
@@ -25,12 +28,25 @@ class StubBroker:
 
     def __init__(self) -> None:
         self.orders: list[OrderRequest] = []
-        self.position_map: dict[str, int] = {}
+        self._position_map: dict[str, int] = {}
+        self.processed = asyncio.Event()
+        self._positions_cache: list[Position] | None = None
+
+    @property
+    def position_map(self) -> Mapping[str, int]:
+        """Read-only view; write through set_position so the cached list stays fresh."""
+        return MappingProxyType(self._position_map)
+
+    def set_position(self, symbol: str, quantity: int) -> None:
+        if quantity == 0:
+            self._position_map.pop(symbol, None)
+        else:
+            self._position_map[symbol] = quantity
+        self._positions_cache = None
 
     async def get_positions(self) -> list[Position]:
-        positions: list[Position] = []
-        for symbol, quantity in self.position_map.items():
-            positions.append(
+        if self._positions_cache is None:
+            self._positions_cache = [
                 Position(
                     contract=SymbolContract(symbol=symbol),
                     quantity=quantity,
@@ -38,12 +54,22 @@ class StubBroker:
                     market_value=Decimal("0"),
                     unrealized_pnl=Decimal("0"),
                 )
-            )
-        return positions
+                for symbol, quantity in self._position_map.items()
+            ]
+        return self._positions_cache
 
     async def place_order(self, order_request: OrderRequest) -> OrderResult:
         self.orders.append(order_request)
-        return OrderResult(
+        symbol = order_request.contract.symbol
+        delta = (
+            order_request.quantity
+            if order_request.side == OrderSide.BUY
+            else -order_request.quantity
+        )
+        self.set_position(symbol, self._position_map.get(symbol, 0) + delta)
+        self.processed.set()
+        # Fields come straight from an already-validated OrderRequest, so skip re-validation.
+        return OrderResult.model_construct(
             order_id=len(self.orders),
             contract=order_request.contract,
             side=order_request.side,
@@ -55,20 +81,23 @@ class StubBroker:
         )
 
 
-async def _emit_prices(event_bus: EventBus, symbol: str, prices: list[float | Decimal]) -> None:
-    for price in prices:
-        event = MarketDataEvent(
+async def _emit_prices(event_bus: EventBus, symbol: str, prices: list[float]) -> None:
+    # Strategy._run_event_loop converts non-Decimal prices once on receipt, so publish raw floats.
+    timestamp = datetime.now(UTC)
+    events = [
+        MarketDataEvent(
             symbol=symbol,
-            price=Decimal(str(price)),
-            timestamp=datetime.now(UTC),
+            price=price,  # type: ignore[arg-type]
+            timestamp=timestamp,
         )
-        await event_bus.publish(EventTopic.MARKET_DATA, event)
-        await asyncio.sleep(0)
+        for price in prices
+    ]
+    await event_bus.publish_many(EventTopic.MARKET_DATA, events)
+    await asyncio.sleep(0)
 
 
 @pytest.mark.asyncio
-async def test_sma_strategy_generates_buy_signal() -> None:
-    event_bus = EventBus()
+async def test_sma_strategy_generates_buy_signal(event_bus: EventBus) -> None:
     broker = StubBroker()
     config = SMAConfig(symbols=["AAPL"], fast_period=2, slow_period=3, position_size=1)
     strategy = SimpleMovingAverageStrategy(config=config, broker=broker, event_bus=event_bus)
@@ -76,7 +105,7 @@ async def test_sma_strategy_generates_buy_signal() -> None:
     await strategy.start()
     try:
         await _emit_prices(event_bus, "AAPL", [3, 2, 1, 2, 3])
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(broker.processed.wait(), timeout=1.0)
     finally:
         await strategy.stop()
 
@@ -87,20 +116,75 @@ async def test_sma_strategy_generates_buy_signal() -> None:
 
 
 @pytest.mark.asyncio
-async def test_sma_strategy_generates_sell_signal() -> None:
-    event_bus = EventBus()
+async def test_sma_strategy_generates_sell_signal(event_bus: EventBus) -> None:
     broker = StubBroker()
-    broker.position_map["AAPL"] = 1
+    broker.set_position("AAPL", 1)
     config = SMAConfig(symbols=["AAPL"], fast_period=2, slow_period=3, position_size=1)
     strategy = SimpleMovingAverageStrategy(config=config, broker=broker, event_bus=event_bus)
 
     await strategy.start()
     try:
         await _emit_prices(event_bus, "AAPL", [1, 2, 3, 2, 1])
-        await asyncio.sleep(0.1)
+        await asyncio.wait_for(broker.processed.wait(), timeout=1.0)
     finally:
         await strategy.stop()
 
     assert broker.orders, "Expected sell order to be submitted"
     order = broker.orders[-1]
     assert order.side == OrderSide.SELL
+
+
+def test_sma_rolling_sums_track_sliding_window(event_bus: EventBus) -> None:
+    config = SMAConfig(symbols=["AAPL"], fast_period=2, slow_period=3, position_size=1)
+    strategy = SimpleMovingAverageStrategy(config=config, broker=StubBroker(), event_bus=event_bus)
+
+    results = [strategy._update_smas("AAPL", Decimal(price)) for price in ("1", "2", "3", "10")]
+
+    assert results[0] == (None, None)
+    assert results[1] == (Decimal("1.5"), None)
+    assert results[2] == (Decimal("2.5"), Decimal("2"))
+    assert results[3] == (Decimal("6.5"), Decimal("5"))
+
+
+def _per_tick_signals(strategy: SimpleMovingAverageStrategy, prices: list[Decimal]) -> list[int]:
+    """Replay prices through the Decimal SMA path and record on_bar's crossover signals."""
+    expected: list[int] = []
+    prev_above: bool | None = None
+    for price in prices:
+        fast_sma, slow_sma = strategy._update_smas("AAPL", price)
+        signal = 0
+        if fast_sma is not None and slow_sma is not None:
+            above = fast_sma > slow_sma
+            if prev_above is not None and above != prev_above:
+                signal = 1 if above else -1
+            prev_above = above
+        expected.append(signal)
+    return expected
+
+
+def test_sma_run_batch_matches_per_tick_crossovers(event_bus: EventBus) -> None:
+    config = SMAConfig(symbols=["AAPL"], fast_period=2, slow_period=3, position_size=1)
+    strategy = SimpleMovingAverageStrategy(config=config, broker=StubBroker(), event_bus=event_bus)
+    prices = [3, 2, 1, 2, 3, 4, 3, 2, 1, 1, 2, 5, 4, 3]
+
+    expected = _per_tick_signals(strategy, [Decimal(price) for price in prices])
+
+    signals = strategy.run_batch([float(price) for price in prices])
+
+    assert signals.tolist() == expected
+    assert signals[4] == 1
+
+
+def test_sma_run_batch_treats_decimal_ties_as_not_above(event_bus: EventBus) -> None:
+    config = SMAConfig(symbols=["AAPL"], fast_period=2, slow_period=4, position_size=1)
+    strategy = SimpleMovingAverageStrategy(config=config, broker=StubBroker(), event_bus=event_bus)
+    # Tick-sized prices on a narrow range make exact SMA ties common; compared as float
+    # sums, a few of them read as "above" and flip the signal.
+    rng = random.Random(0)
+    prices = [Decimal(rng.randint(500, 510)) / 10 for _ in range(200)]
+
+    expected = _per_tick_signals(strategy, prices)
+
+    signals = strategy.run_batch(prices)
+
+    assert signals.tolist() == expected
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 import pytest
@@ -26,10 +27,11 @@ def test_strategy_config_round_trip(tmp_path: Path) -> None:
         data={"order_book": [tmp_path / "ob.csv"]},
     )
 
-    path = tmp_path / "config.json"
-    config.dump_json(path)
+    buffer = io.BytesIO()
+    config.dump_json(buffer)
+    buffer.seek(0)
 
-    loaded = StrategyConfig.load(path)
+    loaded = StrategyConfig.load(buffer)
 
     assert isinstance(loaded, FixedSpreadMMConfig)
     assert loaded.execution.spread == 0.25
@@ -37,25 +39,11 @@ def test_strategy_config_round_trip(tmp_path: Path) -> None:
     assert loaded.data.order_book[0] == tmp_path / "ob.csv"
 
 
-def test_strategy_factory_creates_fixed_spread_strategy() -> None:
-    config = FixedSpreadMMConfig(symbol="AAPL", execution={"spread": 0.15, "quote_size": 1})
-    strategy = StrategyFactory.create(config)
-    from ibkr_trader.sim.strategies import FixedSpreadMMStrategy
-
-    assert isinstance(strategy, FixedSpreadMMStrategy)
-
-
-def test_vol_overlay_config_loads() -> None:
-    config = VolatilityOverlayConfig(symbol="SPY", execution={"volatility_target": 0.12})
-    strategy = StrategyFactory.create(config)
-    from ibkr_trader.sim.advanced_strategies import VolatilityOverlayStrategy
-
-    assert isinstance(strategy, VolatilityOverlayStrategy)
-    assert strategy.config.execution.volatility_target == 0.12
-
-
-def test_additional_strategy_configs_create_stub_strategies() -> None:
-    configs = [
+@pytest.mark.parametrize(
+    "config",
+    [
+        FixedSpreadMMConfig(symbol="AAPL", execution={"spread": 0.15, "quote_size": 1}),
+        VolatilityOverlayConfig(symbol="SPY", execution={"volatility_target": 0.12}),
         MeanReversionConfig(symbol="AAPL"),
         SkewArbitrageConfig(symbol="AAPL", execution={"expiries": ["2024-01-19"]}),
         MicrostructureMLConfig(symbol="AAPL", execution={"model_path": "models/mm.onnx"}),
@@ -63,12 +51,37 @@ def test_additional_strategy_configs_create_stub_strategies() -> None:
             symbol="SPY", execution={"target_allocations": {"bull": {"SPY": 0.7, "TLT": 0.3}}}
         ),
         VolSpilloverConfig(symbol="VIX", execution={"asset_pairs": [["SPY", "VIX"]]}),
-    ]
+    ],
+    ids=lambda config: config.strategy_type,
+)
+def test_strategy_factory_creates_strategy(config: StrategyConfig) -> None:
+    # Imported here: loading the strategy modules before strategy_configs is circular.
+    from ibkr_trader.sim.advanced_strategies import (
+        MeanReversionStrategy,
+        MicrostructureMLStrategy,
+        RegimeRotationStrategy,
+        SkewArbitrageStrategy,
+        VolatilityOverlayStrategy,
+        VolSpilloverStrategy,
+    )
+    from ibkr_trader.sim.strategies import FixedSpreadMMStrategy
+
+    expected_class = {
+        FixedSpreadMMConfig: FixedSpreadMMStrategy,
+        VolatilityOverlayConfig: VolatilityOverlayStrategy,
+        MeanReversionConfig: MeanReversionStrategy,
+        SkewArbitrageConfig: SkewArbitrageStrategy,
+        MicrostructureMLConfig: MicrostructureMLStrategy,
+        RegimeRotationConfig: RegimeRotationStrategy,
+        VolSpilloverConfig: VolSpilloverStrategy,
+    }[type(config)]
+
+    strategy = StrategyFactory.create(config)
 
-    for cfg in configs:
-        strategy = StrategyFactory.create(cfg)
-        assert hasattr(strategy, "config")
-        assert strategy.config.strategy_type == cfg.strategy_type
+    assert isinstance(strategy, expected_class)
+    # FixedSpreadMMStrategy takes unpacked settings and keeps no config.
+    if not isinstance(strategy, FixedSpreadMMStrategy):
+        assert strategy.config == config
 
 
 def test_unknown_strategy_type_raises(tmp_path: Path) -> None:
@@ -14,6 +14,7 @@ from __future__ import annotations
 import asyncio
 from datetime import UTC, datetime
 from decimal import Decimal
+from functools import cache
 
 import pytest
 
@@ -22,6 +23,7 @@ from ibkr_trader.events import EventBus, EventTopic, MarketDataEvent
 from ibkr_trader.models import (
     OrderRequest,
     OrderSide,
+    OrderStatus,
     OrderType,
     SymbolContract,
 )
@@ -29,6 +31,13 @@ from ibkr_trader.sim.broker import SimulatedBroker
 from ibkr_trader.strategy import SimpleMovingAverageStrategy, SMAConfig
 from model.data.models import BookSide, OrderBookLevel, OrderBookSnapshot
 
+_T0 = datetime.now(UTC)
+
+
+@cache
+def _contract(symbol: str) -> SymbolContract:
+    return SymbolContract(symbol=symbol)
+
 
 class UniversalTestStrategy(BaseStrategy):
     """Strategy designed to work in all contexts (live, backtest, replay).
@@ -45,6 +54,14 @@ class UniversalTestStrategy(BaseStrategy):
         self.sell_threshold = sell_threshold
         self.prices: list[Decimal] = []
         self.orders_placed = 0
+        # Validated once; each signal copies a template and fills in the per-bar fields
+        self._buy_template = OrderRequest(
+            contract=_contract(symbol),
+            side=OrderSide.BUY,
+            quantity=10,
+            order_type=OrderType.MARKET,
+        )
+        self._sell_template = self._buy_template.model_copy(update={"side": OrderSide.SELL})
 
     async def on_bar(self, symbol: str, price: Decimal, broker: BrokerProtocol) -> None:
         if symbol != self.symbol:
@@ -57,34 +74,22 @@ class UniversalTestStrategy(BaseStrategy):
 
         if price < self.buy_threshold and position == 0:
             await broker.place_order(
-                OrderRequest(
-                    contract=SymbolContract(symbol=symbol),
-                    side=OrderSide.BUY,
-                    quantity=10,
-                    order_type=OrderType.MARKET,
-                    expected_price=price,
-                )
+                self._buy_template.model_copy(update={"expected_price": price})
             )
             self.orders_placed += 1
 
         elif price > self.sell_threshold and position > 0:
             await broker.place_order(
-                OrderRequest(
-                    contract=SymbolContract(symbol=symbol),
-                    side=OrderSide.SELL,
-                    quantity=position,
-                    order_type=OrderType.MARKET,
-                    expected_price=price,
+                self._sell_template.model_copy(
+                    update={"quantity": position, "expected_price": price}
                 )
             )
             self.orders_placed += 1
 
 
 @pytest.mark.asyncio
-async def test_universal_strategy_works_in_simulated_backtest() -> None:
+async def test_universal_strategy_works_in_simulated_backtest(broker: SimulatedBroker) -> None:
     """Verify UniversalTestStrategy works with SimulatedBroker (backtest context)."""
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = UniversalTestStrategy(
         symbol="AAPL",
         buy_threshold=Decimal("100.00"),
@@ -108,10 +113,8 @@ async def test_universal_strategy_works_in_simulated_backtest() -> None:
 
 
 @pytest.mark.asyncio
-async def test_universal_strategy_works_with_event_bus_integration() -> None:
+async def test_universal_strategy_works_with_event_bus_integration(broker: SimulatedBroker) -> None:
     """Verify strategy works when integrated with live event bus (live context pattern)."""
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = UniversalTestStrategy(
         symbol="AAPL",
         buy_threshold=Decimal("100.00"),
@@ -130,15 +133,16 @@ async def test_universal_strategy_works_with_event_bus_integration() -> None:
 
 
 @pytest.mark.asyncio
-async def test_sma_strategy_works_in_live_context() -> None:
+async def test_sma_strategy_works_in_live_context(
+    event_bus: EventBus, broker: SimulatedBroker
+) -> None:
     """Verify SimpleMovingAverageStrategy (extends BaseStrategy) works with SimulatedBroker."""
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     config = SMAConfig(symbols=["AAPL"], fast_period=2, slow_period=3, position_size=5)
     strategy = SimpleMovingAverageStrategy(config=config, broker=broker, event_bus=event_bus)
 
     # Start strategy (it will subscribe to event bus)
     await strategy.start()
+    order_updates = event_bus.subscribe(EventTopic.ORDER_STATUS)
 
     try:
         # Emit prices that trigger a buy signal (downtrend then uptrend)
@@ -152,12 +156,12 @@ async def test_sma_strategy_works_in_live_context() -> None:
             Decimal("101.00"),  # Fast crosses above slow (buy signal)
         ]
         for price in prices:
-            event = MarketDataEvent(symbol="AAPL", price=price, timestamp=datetime.now(UTC))
+            event = MarketDataEvent(symbol="AAPL", price=price, timestamp=_T0)
             await event_bus.publish(EventTopic.MARKET_DATA, event)
-            await asyncio.sleep(0.01)  # Allow strategy to process
 
-        # Give strategy time to process final events
-        await asyncio.sleep(0.1)
+        # Wait for the crossover order to be submitted; the fill lands a second later
+        status = await asyncio.wait_for(order_updates.get(), timeout=1.0)
+        assert status.status == OrderStatus.SUBMITTED
 
         # Verify strategy placed orders (or at least executed logic)
         # Note: SMA strategy may not always place orders depending on exact signal logic
@@ -167,11 +171,12 @@ async def test_sma_strategy_works_in_live_context() -> None:
         assert isinstance(positions, list)
 
     finally:
+        order_updates.close()
         await strategy.stop()
 
 
 @pytest.mark.asyncio
-async def test_strategy_portability_with_position_tracking() -> None:
+async def test_strategy_portability_with_position_tracking(broker: SimulatedBroker) -> None:
     """Verify strategies track positions consistently across contexts."""
 
     class PositionAwareStrategy(BaseStrategy):
@@ -192,7 +197,7 @@ async def test_strategy_portability_with_position_tracking() -> None:
             if position == 0:
                 await broker.place_order(
                     OrderRequest(
-                        contract=SymbolContract(symbol=symbol),
+                        contract=_contract(symbol),
                         side=OrderSide.BUY,
                         quantity=10,
                         order_type=OrderType.MARKET,
@@ -202,7 +207,7 @@ async def test_strategy_portability_with_position_tracking() -> None:
             elif position > 0:
                 await broker.place_order(
                     OrderRequest(
-                        contract=SymbolContract(symbol=symbol),
+                        contract=_contract(symbol),
                         side=OrderSide.SELL,
                         quantity=position,
                         order_type=OrderType.MARKET,
@@ -210,8 +215,6 @@ async def test_strategy_portability_with_position_tracking() -> None:
                     )
                 )
 
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = PositionAwareStrategy(symbol="AAPL")
 
     # First bar: flat -> buy
@@ -228,7 +231,7 @@ async def test_strategy_portability_with_position_tracking() -> None:
 
 
 @pytest.mark.asyncio
-async def test_strategy_ignores_irrelevant_symbols() -> None:
+async def test_strategy_ignores_irrelevant_symbols(broker: SimulatedBroker) -> None:
     """Verify strategies correctly filter events by symbol."""
 
     class SingleSymbolStrategy(BaseStrategy):
@@ -243,8 +246,6 @@ async def test_strategy_ignores_irrelevant_symbols() -> None:
                 return
             self.bars_processed += 1
 
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = SingleSymbolStrategy(symbol="AAPL")
 
     # Process bars for multiple symbols
@@ -289,10 +290,8 @@ async def test_strategy_lifecycle_methods() -> None:
 
 
 @pytest.mark.asyncio
-async def test_multiple_strategies_with_same_broker() -> None:
+async def test_multiple_strategies_with_same_broker(broker: SimulatedBroker) -> None:
     """Verify multiple strategies can share the same broker instance."""
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
 
     strategy1 = UniversalTestStrategy(
         symbol="AAPL",
@@ -305,9 +304,11 @@ async def test_multiple_strategies_with_same_broker() -> None:
         sell_threshold=Decimal("220.00"),
     )
 
-    # Both strategies process events with same broker
-    await strategy1.on_bar("AAPL", Decimal("99.00"), broker)  # Buy AAPL
-    await strategy2.on_bar("MSFT", Decimal("199.00"), broker)  # Buy MSFT
+    # Both strategies process events concurrently against the same broker
+    await asyncio.gather(
+        strategy1.on_bar("AAPL", Decimal("99.00"), broker),  # Buy AAPL
+        strategy2.on_bar("MSFT", Decimal("199.00"), broker),  # Buy MSFT
+    )
 
     # Verify both placed orders
     assert strategy1.orders_placed == 1
@@ -321,7 +322,7 @@ async def test_multiple_strategies_with_same_broker() -> None:
 
 
 @pytest.mark.asyncio
-async def test_strategy_with_empty_position_list() -> None:
+async def test_strategy_with_empty_position_list(broker: SimulatedBroker) -> None:
     """Verify strategy handles empty position list correctly."""
 
     class QueryStrategy(BaseStrategy):
@@ -329,8 +330,6 @@ async def test_strategy_with_empty_position_list() -> None:
 
         pass
 
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = QueryStrategy()
 
     # Query position when no positions exist
@@ -339,7 +338,7 @@ async def test_strategy_with_empty_position_list() -> None:
 
 
 @pytest.mark.asyncio
-async def test_strategy_replay_simulation_with_order_book() -> None:
+async def test_strategy_replay_simulation_with_order_book(broker: SimulatedBroker) -> None:
     """Verify strategies can work in replay context with order book data."""
 
     class OrderBookStrategy(BaseStrategy):
@@ -352,25 +351,26 @@ async def test_strategy_replay_simulation_with_order_book() -> None:
         async def on_order_book(self, snapshot: OrderBookSnapshot, broker: BrokerProtocol) -> None:
             self.snapshots_processed += 1
 
-            # Extract best bid
-            bid_levels = [level for level in snapshot.levels if level.side == BookSide.BID]
-            if bid_levels:
-                best_bid = max(level.price for level in bid_levels)
+            # Replay level numbering starts at 1 and is not a reliable best-price marker,
+            # so pick the best bid by price in one pass without building a bid list
+            best_bid = max(
+                (level.price for level in snapshot.levels if level.side == BookSide.BID),
+                default=None,
+            )
+            if best_bid is not None:
                 self.best_bids.append(best_bid)
 
     # Note: This requires MockBroker in actual replay, but we can test the callback
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = OrderBookStrategy()
 
     # Manually trigger order book callback
     snapshot = OrderBookSnapshot(
         symbol="AAPL",
-        timestamp=datetime.now(UTC),
+        timestamp=_T0,
         levels=[
-            OrderBookLevel(side=BookSide.BID, price=100.50, size=1000, level=0),
-            OrderBookLevel(side=BookSide.BID, price=100.45, size=500, level=1),
-            OrderBookLevel(side=BookSide.ASK, price=100.55, size=800, level=0),
+            OrderBookLevel(side=BookSide.BID, price=100.45, size=500, level=2),
+            OrderBookLevel(side=BookSide.BID, price=100.50, size=1000, level=1),
+            OrderBookLevel(side=BookSide.ASK, price=100.55, size=800, level=1),
         ],
     )
 
@@ -381,7 +381,7 @@ async def test_strategy_replay_simulation_with_order_book() -> None:
 
 
 @pytest.mark.asyncio
-async def test_strategy_context_agnostic_design() -> None:
+async def test_strategy_context_agnostic_design(broker: SimulatedBroker) -> None:
     """Verify strategy doesn't store broker reference (context-agnostic pattern)."""
 
     class ProperStrategy(BaseStrategy):
@@ -398,7 +398,7 @@ async def test_strategy_context_agnostic_design() -> None:
             if position == 0 and self.bar_count == 1:
                 await broker.place_order(
                     OrderRequest(
-                        contract=SymbolContract(symbol=symbol),
+                        contract=_contract(symbol),
                         side=OrderSide.BUY,
                         quantity=5,
                         order_type=OrderType.MARKET,
@@ -406,8 +406,6 @@ async def test_strategy_context_agnostic_design() -> None:
                     )
                 )
 
-    event_bus = EventBus()
-    broker = SimulatedBroker(event_bus=event_bus)
     strategy = ProperStrategy()
 
     # Strategy should not have broker attribute
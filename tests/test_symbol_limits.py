@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import io
 from datetime import UTC, datetime
 from decimal import Decimal
-from pathlib import Path
 
 import pytest
 
@@ -12,6 +12,8 @@ from ibkr_trader.events import ExecutionEvent
 from ibkr_trader.models import OrderSide, SymbolContract
 from ibkr_trader.portfolio import PortfolioState, RiskGuard, SymbolLimitRegistry
 
+_CONTRACTS = {symbol: SymbolContract(symbol=symbol) for symbol in ("AAPL", "MSFT", "TSLA")}
+
 
 @pytest.mark.asyncio
 async def test_symbol_limits_override_global() -> None:
@@ -33,7 +35,7 @@ async def test_symbol_limits_override_global() -> None:
 
     # Order within limit should pass
     await guard.validate_order(
-        contract=SymbolContract(symbol="AAPL"),
+        contract=_CONTRACTS["AAPL"],
         side=OrderSide.BUY,
         quantity=5,
         price=Decimal("100"),
@@ -42,7 +44,7 @@ async def test_symbol_limits_override_global() -> None:
     # Order exceeding limit should raise
     with pytest.raises(RuntimeError) as exc_info:
         await guard.validate_order(
-            contract=SymbolContract(symbol="AAPL"),
+            contract=_CONTRACTS["AAPL"],
             side=OrderSide.BUY,
             quantity=6,
             price=Decimal("100"),
@@ -70,7 +72,7 @@ async def test_symbol_limits_fallback_to_default() -> None:
 
     # Within default limit
     await guard.validate_order(
-        contract=SymbolContract(symbol="MSFT"),
+        contract=_CONTRACTS["MSFT"],
         side=OrderSide.BUY,
         quantity=10,
         price=Decimal("100"),
@@ -79,7 +81,7 @@ async def test_symbol_limits_fallback_to_default() -> None:
     # Exceeds default limit
     with pytest.raises(RuntimeError):
         await guard.validate_order(
-            contract=SymbolContract(symbol="MSFT"),
+            contract=_CONTRACTS["MSFT"],
             side=OrderSide.BUY,
             quantity=11,
             price=Decimal("100"),
@@ -108,7 +110,7 @@ async def test_symbol_limits_daily_loss_enforced() -> None:
     await portfolio.record_execution_event(
         ExecutionEvent(
             order_id=1,
-            contract=SymbolContract(symbol="TSLA"),
+            contract=_CONTRACTS["TSLA"],
             side=OrderSide.BUY,
             quantity=1,
             price=Decimal("200"),
@@ -119,7 +121,7 @@ async def test_symbol_limits_daily_loss_enforced() -> None:
 
     with pytest.raises(RuntimeError) as exc_info:
         await guard.validate_order(
-            contract=SymbolContract(symbol="TSLA"),
+            contract=_CONTRACTS["TSLA"],
             side=OrderSide.BUY,
             quantity=1,
             price=Decimal("200"),
@@ -128,8 +130,8 @@ async def test_symbol_limits_daily_loss_enforced() -> None:
     assert "Daily loss limit reached" in str(exc_info.value)
 
 
-def test_symbol_limits_persistence(tmp_path: Path) -> None:
-    """Symbol limit configuration persists to disk and can be reloaded."""
+def test_symbol_limits_persistence() -> None:
+    """Symbol limit configuration serialises to JSON and can be reloaded."""
 
     registry = SymbolLimitRegistry()
     registry.set_default_limit(
@@ -144,10 +146,11 @@ def test_symbol_limits_persistence(tmp_path: Path) -> None:
         max_daily_loss=Decimal("150"),
     )
 
-    path = tmp_path / "symbol_limits.json"
-    registry.save_config(path)
+    buffer = io.BytesIO()
+    registry.save_config(buffer)
+    buffer.seek(0)
 
-    reloaded = SymbolLimitRegistry(config_path=path)
+    reloaded = SymbolLimitRegistry.load(buffer)
     default_limits = reloaded.default_limits
     symbol_limits = reloaded.get_limit("AAPL")
 
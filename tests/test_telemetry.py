@@ -29,18 +29,18 @@ def test_file_telemetry_sink_writes_json(tmp_path: Path) -> None:
 
     assert record["message"] == "cache nearing ttl"
     assert record["level"] == "WARNING"
-    assert record["context"]["age"] == 12.5
+    assert record["context"]["age"] == "12.5"
 
 
 @pytest.mark.asyncio
-async def test_event_bus_sink_publishes_event() -> None:
-    bus = EventBus()
-    reporter = TelemetryReporter(EventBusTelemetrySink(bus))
-
-    reporter.info("rate limit warning", context={"ratio": 0.9})
-
-    subscription = bus.subscribe(EventTopic.DIAGNOSTIC)
-    event = await asyncio.wait_for(subscription.get(), timeout=1.0)
+async def test_event_bus_sink_publishes_event(event_bus: EventBus) -> None:
+    reporter = TelemetryReporter(EventBusTelemetrySink(event_bus))
+
+    async with event_bus.subscribe(EventTopic.DIAGNOSTIC) as subscription:
+        reporter.info("rate limit warning", context={"ratio": 0.9})
+        # The sink publishes from a task scheduled by the reporter; one loop turn delivers it.
+        await asyncio.sleep(0)
+        event = subscription.get_nowait()
 
     assert event.message == "rate limit warning"
     assert event.level == "INFO"
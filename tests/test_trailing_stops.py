@@ -1,15 +1,18 @@
 """Tests for trailing stop functionality."""
 
 import asyncio
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
 
 import pytest
+from pydantic import ValidationError
 
-from ibkr_trader.broker import IBKRBroker
-from ibkr_trader.events import EventBus
+from ibkr_trader.events import EventBus, EventTopic, MarketDataEvent
 from ibkr_trader.models import (
+    OrderRequest,
     OrderResult,
     OrderSide,
     OrderStatus,
@@ -17,7 +20,25 @@ from ibkr_trader.models import (
     TrailingStopConfig,
 )
 from ibkr_trader.telemetry import TelemetryReporter
-from ibkr_trader.trailing_stops import TrailingStop, TrailingStopManager
+from ibkr_trader.trailing_stops import (
+    FileStateStore,
+    MemoryStateStore,
+    StateStore,
+    TrailingStop,
+    TrailingStopManager,
+)
+
+ManagerFactory = Callable[..., TrailingStopManager]
+
+# Validated once; stubs copy it with their own order id.
+_RESULT_TEMPLATE = OrderResult(
+    order_id=0,
+    contract=SymbolContract(symbol="AAPL"),
+    side=OrderSide.SELL,
+    quantity=10,
+    order_type="STP",
+    status=OrderStatus.SUBMITTED,
+)
 
 
 class CollectingTelemetrySink:
@@ -30,24 +51,105 @@ class CollectingTelemetrySink:
         self.events.append(event)
 
 
-def test_trailing_stop_config_requires_trail_amount_or_percent() -> None:
-    """Test that exactly one of trail_amount or trail_percent must be specified."""
-    from pydantic import ValidationError
+class CountingStateStore(MemoryStateStore):
+    """In-memory state store that counts writes."""
 
-    # Neither specified explicitly - should fail
-    with pytest.raises(
-        ValidationError, match="Either trail_amount or trail_percent must be specified"
-    ):
-        TrailingStopConfig(
-            symbol="AAPL",
-            side=OrderSide.SELL,
-            quantity=10,
-            trail_amount=None,
-            trail_percent=None,
-        )
+    def __init__(self) -> None:
+        super().__init__()
+        self.saves = 0
+
+    def save(self, state: dict[str, Any]) -> None:
+        self.saves += 1
+        super().save(state)
+
+
+class StubBroker:
+    """Minimal broker stub that records placed orders."""
+
+    def __init__(self, order_id: int) -> None:
+        self.requests: list[OrderRequest] = []
+        self._result = _RESULT_TEMPLATE.model_copy(update={"order_id": order_id})
+
+    async def place_order(self, order_request: OrderRequest) -> OrderResult:
+        self.requests.append(order_request)
+        return self._result
 
-    # Both specified works in construction but manager/CLI will catch this
-    # The validation through CLI is what matters for user-facing behavior
+
+class FakeClock:
+    """Manually advanced wall clock so rate-limit tests need not sleep."""
+
+    def __init__(self) -> None:
+        self.now = datetime(2025, 1, 2, 15, 30, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def stub_broker(request: pytest.FixtureRequest) -> StubBroker:
+    """Stub broker whose stop orders get the parametrized order id."""
+    return StubBroker(order_id=getattr(request, "param", 1))
+
+
+@pytest.fixture
+async def make_manager(
+    stub_broker: StubBroker, event_bus: EventBus
+) -> AsyncIterator[ManagerFactory]:
+    """Build managers on the stub broker, stopping each one at teardown.
+
+    Tests share one event loop, so a manager left running would leak its market data
+    task into later tests.
+    """
+    managers: list[TrailingStopManager] = []
+
+    def _make(
+        state_file: str | Path | StateStore | None = None,
+        *,
+        telemetry: TelemetryReporter | None = None,
+        time_fn: Callable[[], datetime] | None = None,
+    ) -> TrailingStopManager:
+        manager = TrailingStopManager(
+            stub_broker,
+            event_bus,
+            state_file if state_file is not None else MemoryStateStore(),
+            telemetry=telemetry,
+            time_fn=time_fn,
+        )
+        managers.append(manager)
+        return manager
+
+    yield _make
+    for manager in managers:
+        await manager.stop()
+
+
+INVALID_CONFIGS = [
+    (
+        {"trail_amount": None, "trail_percent": None},
+        "Either trail_amount or trail_percent must be specified",
+    ),
+    ({"trail_amount": Decimal("-5.00")}, "trail_amount must be positive"),
+    ({"trail_amount": Decimal("0")}, "trail_amount must be positive"),
+    ({"trail_percent": Decimal("0")}, "trail_percent must be between 0 and 100"),
+    ({"trail_percent": Decimal("100")}, "trail_percent must be between 0 and 100"),
+    ({"trail_percent": Decimal("-5")}, "trail_percent must be between 0 and 100"),
+]
+
+
+@pytest.mark.parametrize(("overrides", "message"), INVALID_CONFIGS)
+def test_trailing_stop_config_rejects_invalid_trail(
+    overrides: dict[str, Any], message: str
+) -> None:
+    """Missing or out-of-range trail values are rejected."""
+    with pytest.raises(ValidationError, match=message):
+        TrailingStopConfig(symbol="AAPL", side=OrderSide.SELL, quantity=10, **overrides)
+
+
+def test_trailing_stop_config_accepts_both_trail_modes() -> None:
+    """Both modes are accepted by the model; the CLI enforces mutual exclusivity."""
     config = TrailingStopConfig(
         symbol="AAPL",
         side=OrderSide.SELL,
@@ -55,62 +157,10 @@ def test_trailing_stop_config_requires_trail_amount_or_percent() -> None:
         trail_amount=Decimal("5.00"),
         trail_percent=Decimal("2.0"),
     )
-    # CLI will enforce mutual exclusivity before constructing this object
     assert config.trail_amount == Decimal("5.00")
     assert config.trail_percent == Decimal("2.0")
 
 
-def test_trailing_stop_config_validates_trail_amount_positive() -> None:
-    """Test that trail_amount must be positive."""
-    with pytest.raises(ValueError, match="trail_amount must be positive"):
-        TrailingStopConfig(
-            symbol="AAPL",
-            side=OrderSide.SELL,
-            quantity=10,
-            trail_amount=Decimal("-5.00"),
-            trail_percent=None,
-        )
-
-    with pytest.raises(ValueError, match="trail_amount must be positive"):
-        TrailingStopConfig(
-            symbol="AAPL",
-            side=OrderSide.SELL,
-            quantity=10,
-            trail_amount=Decimal("0"),
-            trail_percent=None,
-        )
-
-
-def test_trailing_stop_config_validates_trail_percent_range() -> None:
-    """Test that trail_percent must be between 0 and 100."""
-    with pytest.raises(ValueError, match="trail_percent must be between 0 and 100"):
-        TrailingStopConfig(
-            symbol="AAPL",
-            side=OrderSide.SELL,
-            quantity=10,
-            trail_amount=None,
-            trail_percent=Decimal("0"),
-        )
-
-    with pytest.raises(ValueError, match="trail_percent must be between 0 and 100"):
-        TrailingStopConfig(
-            symbol="AAPL",
-            side=OrderSide.SELL,
-            quantity=10,
-            trail_amount=None,
-            trail_percent=Decimal("100"),
-        )
-
-    with pytest.raises(ValueError, match="trail_percent must be between 0 and 100"):
-        TrailingStopConfig(
-            symbol="AAPL",
-            side=OrderSide.SELL,
-            quantity=10,
-            trail_amount=None,
-            trail_percent=Decimal("-5"),
-        )
-
-
 def test_trailing_stop_config_valid_trail_amount() -> None:
     """Test valid trailing stop configuration with trail_amount."""
     config = TrailingStopConfig(
@@ -144,6 +194,41 @@ def test_trailing_stop_config_valid_trail_percent() -> None:
     assert config.trail_percent == Decimal("2.5")
 
 
+def test_trailing_stop_config_trail_factor() -> None:
+    """Percent mode yields a side-aware multiplier; amount mode has none."""
+    long_config = TrailingStopConfig(
+        symbol="AAPL", side=OrderSide.SELL, quantity=10, trail_percent=Decimal("2.0")
+    )
+    short_config = TrailingStopConfig(
+        symbol="AAPL", side=OrderSide.BUY, quantity=10, trail_percent=Decimal("2.0")
+    )
+    amount_config = TrailingStopConfig(
+        symbol="AAPL", side=OrderSide.BUY, quantity=10, trail_amount=Decimal("5.00")
+    )
+
+    assert long_config.trail_factor == Decimal("0.98")
+    assert short_config.stop_price_for(Decimal("100.00")) == Decimal("102.00")
+    assert amount_config.trail_factor is None
+    assert amount_config.stop_price_for(Decimal("150.00")) == Decimal("155.00")
+
+
+def test_trailing_stop_config_trail_factor_tracks_updates() -> None:
+    """The multiplier follows copies and assignments instead of going stale."""
+    config = TrailingStopConfig(
+        symbol="AAPL", side=OrderSide.SELL, quantity=10, trail_percent=Decimal("5")
+    )
+    assert config.stop_price_for(Decimal("100")) == Decimal("95")
+
+    short_copy = config.model_copy(update={"side": OrderSide.BUY})
+    assert short_copy.stop_price_for(Decimal("100")) == Decimal("105")
+
+    wider_copy = config.model_copy(update={"trail_percent": Decimal("10")})
+    assert wider_copy.stop_price_for(Decimal("100")) == Decimal("90")
+
+    config.trail_percent = Decimal("20")
+    assert config.stop_price_for(Decimal("100")) == Decimal("80")
+
+
 def test_trailing_stop_config_normalizes_symbol() -> None:
     """Test that symbol is normalized to uppercase."""
     config = TrailingStopConfig(
@@ -156,6 +241,31 @@ def test_trailing_stop_config_normalizes_symbol() -> None:
     assert config.symbol == "AAPL"
 
 
+def test_trailing_stop_rederives_trail_when_config_replaced() -> None:
+    """The stop caches its side and multiplier per config and refreshes them on replace."""
+    config = TrailingStopConfig(
+        symbol="AAPL", side=OrderSide.SELL, quantity=10, trail_percent=Decimal("5")
+    )
+    trailing_stop = TrailingStop(
+        stop_id="AAPL_1001",
+        config=config,
+        order_id=1001,
+        current_stop_price=Decimal("95"),
+        high_water_mark=Decimal("100"),
+    )
+    assert trailing_stop.is_long
+    assert trailing_stop.stop_price_for(Decimal("100")) == Decimal("95")
+
+    trailing_stop.config = config.model_copy(update={"side": OrderSide.BUY})
+    assert not trailing_stop.is_long
+    assert trailing_stop.stop_price_for(Decimal("100")) == Decimal("105")
+
+    trailing_stop.config = config.model_copy(
+        update={"trail_percent": None, "trail_amount": Decimal("2")}
+    )
+    assert trailing_stop.stop_price_for(Decimal("100")) == Decimal("98")
+
+
 def test_trailing_stop_serialization() -> None:
     """Test TrailingStop to_dict and from_dict serialization."""
     config = TrailingStopConfig(
@@ -194,26 +304,12 @@ def test_trailing_stop_serialization() -> None:
 
 
 @pytest.mark.asyncio
-async def test_trailing_stop_manager_create_stop_with_trail_amount() -> None:
+@pytest.mark.parametrize("stub_broker", [1001], indirect=True)
+async def test_trailing_stop_manager_create_stop_with_trail_amount(
+    stub_broker: StubBroker, make_manager: ManagerFactory
+) -> None:
     """Test creating a trailing stop with dollar amount."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1001,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_stops.json")
-    if state_file.exists():
-        state_file.unlink()
-
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager()
 
     config = TrailingStopConfig(
         symbol="AAPL",
@@ -234,38 +330,20 @@ async def test_trailing_stop_manager_create_stop_with_trail_amount() -> None:
     assert trailing_stop.high_water_mark == initial_price
 
     # Verify order was placed
-    broker_mock.place_order.assert_awaited_once()
-    order_request = broker_mock.place_order.call_args[0][0]
+    assert len(stub_broker.requests) == 1
+    order_request = stub_broker.requests[0]
     assert order_request.contract.symbol == "AAPL"
     assert order_request.side == OrderSide.SELL
     assert order_request.stop_price == Decimal("145.00")
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_manager_create_stop_with_trail_percent() -> None:
+@pytest.mark.parametrize("stub_broker", [1002], indirect=True)
+async def test_trailing_stop_manager_create_stop_with_trail_percent(
+    make_manager: ManagerFactory,
+) -> None:
     """Test creating a trailing stop with percentage."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1002,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_stops_percent.json")
-    if state_file.exists():
-        state_file.unlink()
-
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager()
 
     config = TrailingStopConfig(
         symbol="AAPL",
@@ -281,32 +359,16 @@ async def test_trailing_stop_manager_create_stop_with_trail_percent() -> None:
     # 100 * (1 - 0.02) = 98.00
     assert trailing_stop.current_stop_price == Decimal("98.00")
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_long_position_raises_with_price_increase() -> None:
+@pytest.mark.parametrize("stub_broker", [1003], indirect=True)
+async def test_trailing_stop_long_position_raises_with_price_increase(
+    make_manager: ManagerFactory,
+) -> None:
     """Test that trailing stop for long position raises when price increases."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1003,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_long.json")
-    if state_file.exists():
-        state_file.unlink()
+    clock = FakeClock()
 
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager(time_fn=clock)
     await manager.start()
 
     config = TrailingStopConfig(
@@ -328,41 +390,19 @@ async def test_trailing_stop_long_position_raises_with_price_increase() -> None:
     assert trailing_stop.current_stop_price == Decimal("150.00")
 
     # Wait for rate limit to clear
-    await asyncio.sleep(1.1)
+    clock.advance(1.1)
 
     # Price increases to 160 - stop should raise to 155
     await manager._on_market_data("AAPL", Decimal("160.00"))
     assert trailing_stop.high_water_mark == Decimal("160.00")
     assert trailing_stop.current_stop_price == Decimal("155.00")
 
-    await manager.stop()
-
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_long_position_never_widens() -> None:
+@pytest.mark.parametrize("stub_broker", [1004], indirect=True)
+async def test_trailing_stop_long_position_never_widens(make_manager: ManagerFactory) -> None:
     """Test that trailing stop never moves down (widens) for long position."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1004,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_never_widens.json")
-    if state_file.exists():
-        state_file.unlink()
-
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager()
     await manager.start()
 
     config = TrailingStopConfig(
@@ -378,6 +418,10 @@ async def test_trailing_stop_long_position_never_widens() -> None:
     trailing_stop = manager.active_stops[stop_id]
     original_stop = trailing_stop.current_stop_price
 
+    # Price flat at the high water mark - nothing to do
+    await manager._on_market_data("AAPL", Decimal("150.00"))
+    assert trailing_stop.current_stop_price == original_stop
+
     # Price decreases - stop should NOT move down
     await manager._on_market_data("AAPL", Decimal("145.00"))
     assert trailing_stop.current_stop_price == original_stop
@@ -385,34 +429,16 @@ async def test_trailing_stop_long_position_never_widens() -> None:
     await manager._on_market_data("AAPL", Decimal("140.00"))
     assert trailing_stop.current_stop_price == original_stop
 
-    await manager.stop()
-
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_short_position_lowers_with_price_decrease() -> None:
+@pytest.mark.parametrize("stub_broker", [1005], indirect=True)
+async def test_trailing_stop_short_position_lowers_with_price_decrease(
+    make_manager: ManagerFactory,
+) -> None:
     """Test that trailing stop for short position lowers when price decreases."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1005,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.BUY,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_short.json")
-    if state_file.exists():
-        state_file.unlink()
+    clock = FakeClock()
 
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager(time_fn=clock)
     await manager.start()
 
     config = TrailingStopConfig(
@@ -434,41 +460,133 @@ async def test_trailing_stop_short_position_lowers_with_price_decrease() -> None
     assert trailing_stop.current_stop_price == Decimal("150.00")
 
     # Wait for rate limit to clear
-    await asyncio.sleep(1.1)
+    clock.advance(1.1)
 
     # Price decreases to 140 - stop should lower to 145
     await manager._on_market_data("AAPL", Decimal("140.00"))
     assert trailing_stop.high_water_mark == Decimal("140.00")
     assert trailing_stop.current_stop_price == Decimal("145.00")
 
-    await manager.stop()
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_broker", [1012], indirect=True)
+async def test_trailing_stop_conflates_queued_market_data(
+    make_manager: ManagerFactory, event_bus: EventBus
+) -> None:
+    """A burst of queued ticks is applied once per symbol at its extreme price."""
+    clock = FakeClock()
+    manager = make_manager(time_fn=clock)
+    await manager.start()
+
+    config = TrailingStopConfig(
+        symbol="AAPL",
+        side=OrderSide.SELL,
+        quantity=10,
+        trail_amount=Decimal("5.00"),
+    )
+    stop_id = await manager.create_trailing_stop(config, Decimal("150.00"))
+    trailing_stop = manager.active_stops[stop_id]
+
+    timestamp = clock()
+    await event_bus.publish_many(
+        EventTopic.MARKET_DATA,
+        [
+            MarketDataEvent(symbol="AAPL", price=Decimal(price), timestamp=timestamp)
+            for price in ("152.00", "155.00", "160.00")
+        ],
+    )
+    for _ in range(10):
+        if trailing_stop.high_water_mark == Decimal("160.00"):
+            break
+        await asyncio.sleep(0)
+
+    # Applied tick by tick, 152 would have consumed the rate limit window.
+    assert trailing_stop.high_water_mark == Decimal("160.00")
+    assert trailing_stop.current_stop_price == Decimal("155.00")
+
+
+async def _publish_burst(
+    event_bus: EventBus, clock: FakeClock, symbol: str, prices: tuple[str, ...]
+) -> None:
+    """Queue a burst of ticks and give the manager a few loop turns to drain it."""
+    timestamp = clock()
+    await event_bus.publish_many(
+        EventTopic.MARKET_DATA,
+        [
+            MarketDataEvent(symbol=symbol, price=Decimal(price), timestamp=timestamp)
+            for price in prices
+        ],
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
 
 
 @pytest.mark.asyncio
-async def test_trailing_stop_activation_threshold() -> None:
-    """Test that trailing stop only activates above threshold price."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1006,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
+@pytest.mark.parametrize(
+    ("stub_broker", "side", "prices", "high_water_mark", "stop_price"),
+    [
+        (1014, OrderSide.SELL, ("110", "105"), "110", "105"),
+        (1015, OrderSide.BUY, ("90", "95"), "90", "95"),
+    ],
+    indirect=["stub_broker"],
+)
+async def test_trailing_stop_conflation_keeps_burst_extreme(
+    make_manager: ManagerFactory,
+    event_bus: EventBus,
+    side: OrderSide,
+    prices: tuple[str, ...],
+    high_water_mark: str,
+    stop_price: str,
+) -> None:
+    """A peak (or trough) followed by a retrace inside one burst still moves the stop."""
+    clock = FakeClock()
+    manager = make_manager(time_fn=clock)
+    await manager.start()
+
+    config = TrailingStopConfig(symbol="AAPL", side=side, quantity=10, trail_amount=Decimal("5"))
+    stop_id = await manager.create_trailing_stop(config, Decimal("100"))
+    trailing_stop = manager.active_stops[stop_id]
+    clock.advance(1.1)
+
+    await _publish_burst(event_bus, clock, "AAPL", prices)
+
+    assert trailing_stop.high_water_mark == Decimal(high_water_mark)
+    assert trailing_stop.current_stop_price == Decimal(stop_price)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_broker", [1016], indirect=True)
+async def test_trailing_stop_conflation_activates_inside_burst(
+    make_manager: ManagerFactory, event_bus: EventBus
+) -> None:
+    """Crossing the activation price mid-burst activates even if the burst ends below it."""
+    clock = FakeClock()
+    manager = make_manager(time_fn=clock)
+    await manager.start()
+
+    config = TrailingStopConfig(
+        symbol="AAPL",
+        side=OrderSide.SELL,
+        quantity=10,
+        trail_amount=Decimal("5"),
+        activation_price=Decimal("110"),
     )
+    stop_id = await manager.create_trailing_stop(config, Decimal("100"))
+    trailing_stop = manager.active_stops[stop_id]
+    clock.advance(1.1)
 
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_activation.json")
-    if state_file.exists():
-        state_file.unlink()
+    await _publish_burst(event_bus, clock, "AAPL", ("104", "112", "106"))
 
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    assert trailing_stop.activated
+    assert trailing_stop.high_water_mark == Decimal("112")
+    assert trailing_stop.current_stop_price == Decimal("107")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_broker", [1006], indirect=True)
+async def test_trailing_stop_activation_threshold(make_manager: ManagerFactory) -> None:
+    """Test that trailing stop only activates above threshold price."""
+    manager = make_manager()
     await manager.start()
 
     config = TrailingStopConfig(
@@ -496,35 +614,43 @@ async def test_trailing_stop_activation_threshold() -> None:
     assert trailing_stop.high_water_mark == Decimal("156.00")
     assert trailing_stop.current_stop_price == Decimal("151.00")  # 156 - 5
 
-    await manager.stop()
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_broker", [1010], indirect=True)
+async def test_trailing_stop_state_writes_are_coalesced(make_manager: ManagerFactory) -> None:
+    """Snapshots queued before the writer runs collapse into a single write."""
+    store = CountingStateStore()
+    manager = make_manager(store)
+
+    config = TrailingStopConfig(
+        symbol="AAPL",
+        side=OrderSide.SELL,
+        quantity=10,
+        trail_amount=Decimal("5.00"),
+    )
+    stop_id = await manager.create_trailing_stop(config, Decimal("150.00"))
+    manager.active_stops[stop_id].current_stop_price = Decimal("146.00")
+    manager._save_state()
+    manager.active_stops[stop_id].current_stop_price = Decimal("147.00")
+    manager._save_state()
+    await manager.flush()
+
+    assert store.saves == 1
+    state = store.load()
+    assert state is not None
+    assert state["stops"][0]["current_stop_price"] == "147.00"
 
 
 @pytest.mark.asyncio
-async def test_trailing_stop_state_persistence() -> None:
+@pytest.mark.parametrize("stub_broker", [1007], indirect=True)
+async def test_trailing_stop_state_persistence(
+    make_manager: ManagerFactory, tmp_path: Path
+) -> None:
     """Test that trailing stop state persists across restarts."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1007,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_persistence.json")
-    if state_file.exists():
-        state_file.unlink()
+    state_file = tmp_path / "state.json"
 
     # Create manager and trailing stop
-    manager1 = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager1 = make_manager(state_file)
 
     config = TrailingStopConfig(
         symbol="AAPL",
@@ -535,12 +661,13 @@ async def test_trailing_stop_state_persistence() -> None:
 
     initial_price = Decimal("150.00")
     stop_id = await manager1.create_trailing_stop(config, initial_price)
+    await manager1.flush()
 
     # Verify state file was created
     assert state_file.exists()
 
     # Create new manager - should load persisted state
-    manager2 = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager2 = make_manager(state_file)
     assert stop_id in manager2.active_stops
     assert len(manager2.active_stops) == 1
 
@@ -549,37 +676,38 @@ async def test_trailing_stop_state_persistence() -> None:
     assert restored_stop.current_stop_price == Decimal("145.00")
     assert restored_stop.high_water_mark == Decimal("150.00")
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_broker", [1013], indirect=True)
+async def test_trailing_stop_manager_accepts_str_state_path(
+    make_manager: ManagerFactory, tmp_path: Path
+) -> None:
+    """A plain string path is wrapped in a file store rather than used as a store."""
+    state_file = tmp_path / "state.json"
+    manager = make_manager(str(state_file))
+    assert isinstance(manager.state_store, FileStateStore)
+
+    config = TrailingStopConfig(
+        symbol="AAPL",
+        side=OrderSide.SELL,
+        quantity=10,
+        trail_amount=Decimal("5.00"),
+    )
+    stop_id = await manager.create_trailing_stop(config, Decimal("150.00"))
+    await manager.flush()
+
+    assert state_file.exists()
+    assert stop_id in make_manager(str(state_file)).active_stops
 
 
 @pytest.mark.asyncio
-async def test_trailing_stop_emits_telemetry_events(tmp_path: Path) -> None:
+@pytest.mark.parametrize("stub_broker", [3001], indirect=True)
+async def test_trailing_stop_emits_telemetry_events(make_manager: ManagerFactory) -> None:
     """TrailingStopManager emits telemetry for create/update/rate-limit events."""
     sink = CollectingTelemetrySink()
     telemetry = TelemetryReporter(sink)
 
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=3001,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = tmp_path / "telemetry_trailing_stops.json"
-    manager = TrailingStopManager(
-        broker_mock,
-        event_bus,
-        state_file,
-        telemetry=telemetry,
-    )
+    manager = make_manager(telemetry=telemetry)
 
     config = TrailingStopConfig(
         symbol="AAPL",
@@ -605,30 +733,36 @@ async def test_trailing_stop_emits_telemetry_events(tmp_path: Path) -> None:
     await manager.cancel_trailing_stop(stop_id)
     assert any(event.message == "trailing_stop.cancelled" for event in sink.events)
 
-    await manager.stop()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_cancel() -> None:
-    """Test cancelling a trailing stop."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1008,
-            contract=SymbolContract(symbol="AAPL"),
+@pytest.mark.parametrize("stub_broker", [1011], indirect=True)
+async def test_trailing_stop_ticks_only_touch_their_symbol(make_manager: ManagerFactory) -> None:
+    """Market data for one symbol leaves stops on other symbols untouched."""
+    manager = make_manager()
+    stop_ids = {}
+    for symbol in ("AAPL", "MSFT"):
+        config = TrailingStopConfig(
+            symbol=symbol,
             side=OrderSide.SELL,
             quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
+            trail_amount=Decimal("5.00"),
         )
-    )
+        stop_ids[symbol] = await manager.create_trailing_stop(config, Decimal("150.00"))
+
+    await manager._on_market_data("MSFT", Decimal("155.00"))
+    assert manager.active_stops[stop_ids["MSFT"]].current_stop_price == Decimal("150.00")
+    assert manager.active_stops[stop_ids["AAPL"]].current_stop_price == Decimal("145.00")
 
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_cancel.json")
-    if state_file.exists():
-        state_file.unlink()
+    await manager.cancel_trailing_stop(stop_ids["MSFT"])
+    await manager._on_market_data("MSFT", Decimal("170.00"))
+    assert stop_ids["MSFT"] not in manager.active_stops
 
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stub_broker", [1008], indirect=True)
+async def test_trailing_stop_cancel(make_manager: ManagerFactory) -> None:
+    """Test cancelling a trailing stop."""
+    manager = make_manager()
 
     config = TrailingStopConfig(
         symbol="AAPL",
@@ -647,47 +781,26 @@ async def test_trailing_stop_cancel() -> None:
 
     assert stop_id not in manager.active_stops
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_cancel_nonexistent_raises() -> None:
+async def test_trailing_stop_cancel_nonexistent_raises(make_manager: ManagerFactory) -> None:
     """Test that cancelling non-existent trailing stop raises KeyError."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_cancel_error.json")
-
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager()
 
     with pytest.raises(KeyError, match="Trailing stop INVALID_ID not found"):
         await manager.cancel_trailing_stop("INVALID_ID")
 
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_rate_limit_persists_across_restart(tmp_path: Path) -> None:
+@pytest.mark.parametrize("stub_broker", [3010], indirect=True)
+async def test_trailing_stop_rate_limit_persists_across_restart(
+    make_manager: ManagerFactory, tmp_path: Path
+) -> None:
     """Rate limiter state survives manager restart."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=3010,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
+    clock = FakeClock()
     state_file = tmp_path / "trailing_rate_state.json"
 
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager(state_file, time_fn=clock)
 
     config = TrailingStopConfig(
         symbol="AAPL",
@@ -705,7 +818,7 @@ async def test_trailing_stop_rate_limit_persists_across_restart(tmp_path: Path)
 
     # Persist state and recreate manager
     await manager.stop()
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager(state_file, time_fn=clock)
     trailing_stop = manager.active_stops[stop_id]
 
     # Immediate update should be skipped due to persisted rate limiter
@@ -713,34 +826,18 @@ async def test_trailing_stop_rate_limit_persists_across_restart(tmp_path: Path)
     assert trailing_stop.current_stop_price == first_update_price
 
     # After sleeping beyond interval, update should proceed
-    await asyncio.sleep(1.1)
+    clock.advance(1.1)
     await manager._on_market_data("AAPL", Decimal("165.00"))
     assert trailing_stop.current_stop_price == Decimal("160.00")
 
-    await manager.stop()
-
 
 @pytest.mark.asyncio
-async def test_trailing_stop_rate_limiting() -> None:
+@pytest.mark.parametrize("stub_broker", [1009], indirect=True)
+async def test_trailing_stop_rate_limiting(make_manager: ManagerFactory) -> None:
     """Test that trailing stop updates are rate limited."""
-    broker_mock = MagicMock(spec=IBKRBroker)
-    broker_mock.place_order = AsyncMock(
-        return_value=OrderResult(
-            order_id=1009,
-            contract=SymbolContract(symbol="AAPL"),
-            side=OrderSide.SELL,
-            quantity=10,
-            order_type="STP",
-            status=OrderStatus.SUBMITTED,
-        )
-    )
-
-    event_bus = EventBus()
-    state_file = Path("/tmp/test_trailing_rate_limit.json")
-    if state_file.exists():
-        state_file.unlink()
+    clock = FakeClock()
 
-    manager = TrailingStopManager(broker_mock, event_bus, state_file)
+    manager = make_manager(time_fn=clock)
     manager._min_update_interval = 1.0  # 1 second rate limit
     await manager.start()
 
@@ -766,14 +863,8 @@ async def test_trailing_stop_rate_limiting() -> None:
     # (high water mark updates but stop modification is rate limited)
 
     # Wait for rate limit to expire
-    await asyncio.sleep(1.1)
+    clock.advance(1.1)
 
     # Now update should work
     await manager._on_market_data("AAPL", Decimal("165.00"))
     assert trailing_stop.current_stop_price == Decimal("160.00")
-
-    await manager.stop()
-
-    # Cleanup
-    if state_file.exists():
-        state_file.unlink()
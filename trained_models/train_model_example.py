@@ -1,9 +1,9 @@
-from model.data import FileCacheStore, MarketDataClient, YFinanceMarketDataSource
+from model.data import FileCacheStore, LRUCacheStore, MarketDataClient, YFinanceMarketDataSource
 from model.training.industry_model import train_linear_industry_model
 
 data_client = MarketDataClient(
     source=YFinanceMarketDataSource(),
-    cache=FileCacheStore("data/cache"),
+    cache=LRUCacheStore(capacity=64, backing=FileCacheStore("data/cache")),
 )
 
 artifact_path = train_linear_industry_model(